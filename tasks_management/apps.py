@@ -14,6 +14,18 @@ DEFAULT_CONFIG = {
     # To be used if task should use generic resolver
     "default_executor_event": "default",
     "task_user_approved": "APPROVED",
+    # Evaluate completion policies in the process_task_resolution_jobs worker instead of the resolve mutation
+    "deferred_task_resolution": False,
+    "task_resolution_job_max_attempts": 5,
+    "task_resolution_job_retry_delay_seconds": 60,
+    # `python` - executor votes are merged into business_status in python when read and when the task is completed,
+    # `database` - each vote is merged into the stored business_status with a single UPDATE (PostgreSQL only)
+    "business_status_merge_mode": "python",
+    # Rendered business_data of tasks kept in a process local LRU of the given size (0 disables it),
+    # or in the given django cache alias when set
+    "business_data_cache_size": 0,
+    "business_data_cache_alias": None,
+    "business_data_cache_timeout": 3600,
 }
 
 
@@ -32,6 +44,13 @@ class TasksManagementConfig(AppConfig):
     gql_task_search_all_perms = None
     default_executor_event = None
     task_user_approved = None
+    deferred_task_resolution = None
+    task_resolution_job_max_attempts = None
+    task_resolution_job_retry_delay_seconds = None
+    business_status_merge_mode = None
+    business_data_cache_size = None
+    business_data_cache_alias = None
+    business_data_cache_timeout = None
 
     def ready(self):
         from core.models import ModuleConfiguration
@@ -0,0 +1,82 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+from tasks_management.apps import TasksManagementConfig
+
+_MISSING = object()
+
+
+class BusinessDataCache:
+    """
+    Cache of business_data rendered by task serializers, keyed by task id and version, serializer path and the
+    permission scope (rights) of the user, so a task is rendered again only once it changes. Entries are kept in a
+    process local LRU bounded by `business_data_cache_size`, or in the django cache `business_data_cache_alias`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return bool(TasksManagementConfig.business_data_cache_alias or TasksManagementConfig.business_data_cache_size)
+
+    def get_or_render(self, task, serializer_path, user, render):
+        if not self.enabled:
+            return render()
+
+        key = self._key(task, serializer_path, user)
+        value = self._get(key)
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is _MISSING:
+            value = render()
+            self._set(key, value)
+        return value
+
+    def get_stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get(self, key):
+        if TasksManagementConfig.business_data_cache_alias:
+            return caches[TasksManagementConfig.business_data_cache_alias].get(key, _MISSING)
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key, value):
+        if TasksManagementConfig.business_data_cache_alias:
+            caches[TasksManagementConfig.business_data_cache_alias].set(
+                key, value, TasksManagementConfig.business_data_cache_timeout)
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > TasksManagementConfig.business_data_cache_size:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _key(task, serializer_path, user):
+        rights = ','.join(sorted(str(right) for right in (getattr(user, 'rights', None) or [])))
+        key = f'{task.id}:{task.version}:{serializer_path}:{rights}'
+        return 'tasks_management.business_data.' + hashlib.sha1(key.encode()).hexdigest()
+
+
+business_data_cache = BusinessDataCache()
@@ -0,0 +1,73 @@
+import logging
+import math
+
+from tasks_management.models import Task, TaskGroup
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_task_all(_task_group, _tally):
+    if _tally.failed:
+        return Task.Status.FAILED
+    if not _tally.executors:
+        logger.warning("No valid executors of task with policy ALL %s", str(_tally.task_id))
+        return None
+    if _tally.approved >= _tally.executors:
+        return Task.Status.COMPLETED
+    return None
+
+
+def resolve_task_any(_task_group, _tally):
+    if _tally.failed:
+        return Task.Status.FAILED
+    if _tally.approved:
+        return Task.Status.COMPLETED
+    return None
+
+
+def resolve_task_n(_task_group, _tally):
+    if not _task_group.completion_threshold:
+        # without a threshold the policy keeps its previous behaviour, same as ANY
+        return resolve_task_any(_task_group, _tally)
+    if not _tally.executors:
+        logger.warning("No valid executors of task with policy N %s", str(_tally.task_id))
+        return None
+    required = get_required_approvals(_task_group, _tally.executors)
+    if _tally.approved >= required:
+        return Task.Status.COMPLETED
+    # the task fails once the remaining executors can no longer reach the threshold
+    if _tally.executors - _tally.failed < required:
+        return Task.Status.FAILED
+    return None
+
+
+def get_required_approvals(task_group, n_of_executors):
+    """
+    Number of approvals required by a task group with the N completion policy. Without a threshold a single approval
+    is enough, a threshold above the number of executors is capped to all executors.
+    """
+    threshold = task_group.completion_threshold
+    if not threshold:
+        return 1
+    if task_group.completion_threshold_type == TaskGroup.TaskGroupCompletionThresholdType.PERCENTAGE:
+        threshold = math.ceil(n_of_executors * threshold / 100)
+    return max(min(threshold, n_of_executors), 1)
+
+
+COMPLETION_POLICY_RESOLVERS = {
+    TaskGroup.TaskGroupCompletionPolicy.ALL: resolve_task_all,
+    TaskGroup.TaskGroupCompletionPolicy.ANY: resolve_task_any,
+    TaskGroup.TaskGroupCompletionPolicy.N: resolve_task_n,
+}
+
+
+def evaluate_completion_policy(task_group, tally):
+    """
+    Returns the status a task should be completed with according to the completion policy of its group
+    (Task.Status.COMPLETED or Task.Status.FAILED), or None while the task is still pending.
+    Raises ValueError for unknown completion policies.
+    """
+    resolver = COMPLETION_POLICY_RESOLVERS.get(task_group.completion_policy)
+    if not resolver:
+        raise ValueError('Unknown completion_policy: %s' % task_group.completion_policy)
+    return resolver(task_group, tally)
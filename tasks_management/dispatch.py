@@ -0,0 +1,235 @@
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from core.forms import User
+from tasks_management.models import Task
+
+logger = logging.getLogger(__name__)
+
+# context of the task_service.complete_task signals sent for the tasks completed by task_service.complete_tasks
+COMPLETE_TASKS_CONTEXT = 'task_service.complete_tasks'
+
+
+def get_signal_user(signal_kwargs, user_id):
+    """
+    User that sent the service signal, taken from the service instance (`cls_`) when it matches user_id.
+    """
+    service = signal_kwargs.get('cls_')
+    user = getattr(service, 'user', None)
+    if user and str(user.id) == str(user_id):
+        return user
+    return User.objects.get(id=user_id)
+
+
+class BusinessEventRegistry:
+    """
+    Maps business events of tasks created by the <Operation>CheckerLogicServiceMixin (`ServiceName.operation`) to the
+    service type and operation executed once the task is completed. Completed tasks are dispatched with a single
+    lookup instead of every module checking the event in its own handler.
+    The business events stored in tasks only contain the class name, so registering two service types with the same
+    name from different modules is an error.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+        self.unmatched_events = Counter()
+
+    def register(self, service_type, operations):
+        with self._lock:
+            business_events = {f'{service_type.__name__}.{operation}': operation for operation in operations}
+            for business_event in business_events:
+                registered = self._operations.get(business_event)
+                if registered and _qualified_name(registered[0]) != _qualified_name(service_type):
+                    raise ValueError(f"Business event {business_event} is already registered for "
+                                     f"{_qualified_name(registered[0])}, "
+                                     f"cannot register {_qualified_name(service_type)}")
+            for business_event, operation in business_events.items():
+                self._operations[business_event] = (service_type, operation)
+
+    def get(self, business_event):
+        return self._operations.get(business_event)
+
+    def report_unmatched(self, business_event):
+        self.unmatched_events[business_event] += 1
+        logger.debug("No service operation registered for business event %s", business_event)
+
+
+def _qualified_name(service_type):
+    return f'{service_type.__module__}.{service_type.__qualname__}'
+
+
+business_event_registry = BusinessEventRegistry()
+
+
+def on_task_complete_business_event(**kwargs):
+    """
+    task_service.complete_task AFTER handler executing the service operation registered for the business event of the
+    completed task. Tasks completed by task_service.complete_tasks are dispatched by on_tasks_complete_business_event.
+    """
+    if kwargs.get('context') == COMPLETE_TASKS_CONTEXT:
+        return
+    try:
+        result = kwargs.get('result', None)
+        if not result or not result['success']:
+            return
+        task = result['data']['task']
+        if task['status'] != Task.Status.COMPLETED:
+            return
+
+        service_operation = business_event_registry.get(task['business_event'])
+        if service_operation is None:
+            business_event_registry.report_unmatched(task['business_event'])
+            return
+
+        service_type, operation = service_operation
+        user = get_signal_user(kwargs, result['data']['user']['id'])
+        getattr(service_type(user), operation)(task['data']['incoming_data'])
+    except Exception as e:
+        logger.error("Error while executing on_task_complete", exc_info=e)
+        return [str(e)]
+
+
+def on_tasks_complete_business_event(**kwargs):
+    """
+    task_service.complete_tasks AFTER handler, batch counterpart of on_task_complete_business_event. The user is
+    loaded once for the batch.
+    """
+    try:
+        result = kwargs.get('result', None)
+        if not result or not result['success']:
+            return
+        data = result['data']
+        incoming_data_by_operation = defaultdict(list)
+        for task in data['tasks']:
+            if task['status'] != Task.Status.COMPLETED:
+                continue
+            service_operation = business_event_registry.get(task['business_event'])
+            if service_operation is None:
+                business_event_registry.report_unmatched(task['business_event'])
+            else:
+                incoming_data_by_operation[service_operation].append(task['data']['incoming_data'])
+        if not incoming_data_by_operation:
+            return
+
+        user = get_signal_user(kwargs, data['user']['id'])
+        errors = []
+        # Tasks of the same service and operation are applied together by the _complete_<operation>_tasks hook
+        for (service_type, operation), objs_data in incoming_data_by_operation.items():
+            try:
+                outputs = getattr(service_type(user), f'_complete_{operation}_tasks')(objs_data)
+                errors += [output.get('detail') for output in outputs or []
+                           if isinstance(output, dict) and not output.get('success', True)]
+            except Exception as e:
+                logger.error("Error while executing on_task_complete", exc_info=e)
+                errors.append(str(e))
+        return errors or None
+    except Exception as e:
+        logger.error("Error while executing on_task_complete", exc_info=e)
+        return [str(e)]
+
+
+class ExecutorActionEventRegistry:
+    """
+    Maps the `executor_action_event` of tasks to the handler run after task_service.resolve_task, so a resolve
+    invokes exactly one handler instead of every module filtering the event in its own signal receiver.
+    Handlers get the signal kwargs. The optional batch handler gets the task_service.resolve_tasks kwargs limited to
+    the tasks of its event, without it the handler is run for each task of the batch.
+    Execution times are collected per event, see get_stats. Handler exceptions are logged and returned as errors, so
+    a failing handler does not prevent the handlers of other events of a batch from running.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers = {}
+        self._stats = defaultdict(lambda: {'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+
+    def register(self, executor_action_event, handler, batch_handler=None):
+        with self._lock:
+            if executor_action_event in self._handlers:
+                logger.warning("Handler of executor action event %s is replaced by %s", executor_action_event, handler)
+            self._handlers[executor_action_event] = (handler, batch_handler)
+
+    def unregister(self, executor_action_event):
+        with self._lock:
+            self._handlers.pop(executor_action_event, None)
+
+    def get(self, executor_action_event):
+        return self._handlers.get(executor_action_event)
+
+    def get_stats(self):
+        with self._lock:
+            return {event: dict(stats) for event, stats in self._stats.items()}
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def run(self, executor_action_event, handler, **kwargs):
+        start = time.perf_counter()
+        try:
+            return handler(**kwargs)
+        except Exception as exc:
+            logger.error("Error while executing handler of executor action event %s", executor_action_event,
+                         exc_info=exc)
+            return [str(exc)]
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stats = self._stats[executor_action_event]
+                stats['calls'] += 1
+                stats['total_seconds'] += elapsed
+                stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+
+
+executor_action_event_registry = ExecutorActionEventRegistry()
+
+
+def on_task_resolve_executor_event(**kwargs):
+    """
+    task_service.resolve_task AFTER handler running the handler registered for the executor action event of the task.
+    """
+    result = kwargs.get('result', None)
+    if not result or not result['success']:
+        return
+    executor_action_event = result['data']['task']['executor_action_event']
+    handlers = executor_action_event_registry.get(executor_action_event)
+    if handlers is None:
+        logger.debug("No handler registered for executor action event %s", executor_action_event)
+        return
+    return executor_action_event_registry.run(executor_action_event, handlers[0], **kwargs)
+
+
+def on_tasks_resolve_executor_event(**kwargs):
+    """
+    task_service.resolve_tasks AFTER handler, the resolved tasks are grouped by executor action event and passed to
+    the registered batch handler, or to the handler one by one.
+    """
+    result = kwargs.get('result', None)
+    if not result or not result['success']:
+        return
+    data = result['data']
+    tasks_by_event = defaultdict(list)
+    for task in data['tasks']:
+        tasks_by_event[task['executor_action_event']].append(task)
+
+    errors = []
+    for executor_action_event, tasks in tasks_by_event.items():
+        handlers = executor_action_event_registry.get(executor_action_event)
+        if handlers is None:
+            logger.debug("No handler registered for executor action event %s", executor_action_event)
+            continue
+        handler, batch_handler = handlers
+        if batch_handler:
+            batch_result = {**result, 'data': {**data, 'tasks': tasks}}
+            errors += executor_action_event_registry.run(
+                executor_action_event, batch_handler, **{**kwargs, 'result': batch_result}) or []
+            continue
+        for task in tasks:
+            tally = data['tallies'][str(task['id'])]
+            task_result = {**result, 'data': {'task': task, 'user': data['user'], 'tally': tally}}
+            errors += executor_action_event_registry.run(
+                executor_action_event, handler, **{**kwargs, 'result': task_result}) or []
+    return errors or None
@@ -0,0 +1,80 @@
+import importlib
+from collections import defaultdict
+
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from tasks_management.models import TaskExecutor
+from tasks_management.utils import load_generic_entities
+
+
+class GenericEntityLoader(DataLoader):
+    """
+    Loads task entities by (content type id, entity id), batching the keys requested while resolving a page into one
+    query per content type.
+    """
+
+    def batch_load_fn(self, keys):
+        entities = load_generic_entities(keys)
+        return Promise.resolve([entities.get((content_type_id, str(entity_id))) for content_type_id, entity_id in keys])
+
+
+class TaskGroupUsersLoader(DataLoader):
+    """
+    Loads the users executing task groups, for all task groups of a page in one query.
+    """
+
+    def batch_load_fn(self, task_group_ids):
+        users_by_task_group = defaultdict(list)
+        executors = TaskExecutor.objects \
+            .filter(task_group_id__in=task_group_ids, is_deleted=False) \
+            .select_related('user', 'user__i_user') \
+            .order_by('date_created')
+        for executor in executors:
+            users_by_task_group[executor.task_group_id].append(executor.user)
+        return Promise.resolve([users_by_task_group.get(task_group_id, []) for task_group_id in task_group_ids])
+
+
+def get_request_loader(info, loader_class):
+    """
+    Loader instance shared by all resolvers of the current request (stored on info.context), so keys are batched and
+    cached per request only.
+    """
+    loaders = getattr(info.context, 'tasks_management_loaders', None)
+    if loaders is None:
+        loaders = {}
+        setattr(info.context, 'tasks_management_loaders', loaders)
+    if loader_class not in loaders:
+        loaders[loader_class] = loader_class()
+    return loaders[loader_class]
+
+
+def get_business_data_serializer(info, serializer_path):
+    """
+    Callable of a business_data_serializer path (`module.ServiceClass.method`) bound to a service instance of the
+    request user. Resolved once per request and user, returns None if the class or method does not exist.
+    """
+    serializers = getattr(info.context, 'tasks_management_serializers', None)
+    if serializers is None:
+        serializers = {}
+        setattr(info.context, 'tasks_management_serializers', serializers)
+    user = info.context.user
+    key = (getattr(user, 'id', None), serializer_path)
+    if key not in serializers:
+        try:
+            serializers[key] = (_load_business_data_serializer(user, serializer_path), None)
+        except Exception as exc:
+            serializers[key] = (None, exc)
+    serializer, error = serializers[key]
+    if error:
+        raise error
+    return serializer
+
+
+def _load_business_data_serializer(user, serializer_path):
+    module_path, class_name, method_name = serializer_path.rsplit('.', 2)
+    service_module = importlib.import_module(module_path)
+    if not hasattr(service_module, class_name):
+        return None
+    serializer_method = getattr(getattr(service_module, class_name)(user), method_name, None)
+    return serializer_method if callable(serializer_method) else None
@@ -5,8 +5,10 @@ from django.core.exceptions import ValidationError
 
 from core.gql.gql_mutations.base_mutation import BaseHistoryModelCreateMutationMixin, BaseMutation, \
     BaseHistoryModelUpdateMutationMixin, BaseHistoryModelDeleteMutationMixin
+from core.models import MutationLog
 from core.schema import OpenIMISMutation
 from tasks_management.apps import TasksManagementConfig
+from tasks_management.identity_map import get_task, task_identity_scope
 from tasks_management.models import TaskGroup, Task, TaskMutation
 from tasks_management.services import TaskGroupService, TaskService
 
@@ -17,8 +19,14 @@ class CreateTaskGroupInput(OpenIMISMutation.Input):
         ANY = TaskGroup.TaskGroupCompletionPolicy.ANY
         N = TaskGroup.TaskGroupCompletionPolicy.N
 
+    class TaskGroupCompletionThresholdTypeEnum(graphene.Enum):
+        ABSOLUTE = TaskGroup.TaskGroupCompletionThresholdType.ABSOLUTE
+        PERCENTAGE = TaskGroup.TaskGroupCompletionThresholdType.PERCENTAGE
+
     code = graphene.String(required=True, max_length=255)
     completion_policy = graphene.Field(TaskGroupCompletionPolicyEnum, required=True)
+    completion_threshold = graphene.Int(required=False)
+    completion_threshold_type = graphene.Field(TaskGroupCompletionThresholdTypeEnum, required=False)
     user_ids = graphene.List(graphene.UUID)
     task_sources = graphene.List(graphene.String)
     task_allowed_sources = graphene.List(graphene.String)
@@ -48,6 +56,12 @@ class ResolveTaskGroupInput(OpenIMISMutation.Input):
     additional_data = graphene.JSONString(required=False)
 
 
+class ResolveTasksInput(OpenIMISMutation.Input):
+    ids = graphene.List(graphene.UUID, required=True)
+    business_status = graphene.JSONString(required=True)
+    additional_data = graphene.JSONString(required=False)
+
+
 class CreateTaskGroupMutation(BaseHistoryModelCreateMutationMixin, BaseMutation):
     _mutation_class = "CreateTaskGroupMutation"
     _mutation_module = "tasks_management"
@@ -177,9 +191,10 @@ class ResolveTaskMutation(BaseHistoryModelUpdateMutationMixin, BaseMutation):
         if "client_mutation_label" in data:
             data.pop('client_mutation_label')
 
-        service = TaskService(user)
-        res = service.resolve_task(data)
-        task = Task.objects.filter(id=data['id']).first()
+        with task_identity_scope():
+            service = TaskService(user)
+            res = service.resolve_task(data)
+            task = get_task(data['id'])
 
         if client_mutation_id:
             TaskMutation.object_mutated(
@@ -191,3 +206,33 @@ class ResolveTaskMutation(BaseHistoryModelUpdateMutationMixin, BaseMutation):
 
     class Input(ResolveTaskGroupInput):
         pass
+
+
+class ResolveTasksMutation(BaseHistoryModelUpdateMutationMixin, BaseMutation):
+    _mutation_class = "ResolveTasksMutation"
+    _mutation_module = "tasks_management"
+    _model = Task
+
+    @classmethod
+    def _mutate(cls, user, **data):
+        client_mutation_id = data.pop('client_mutation_id', None)
+        if "client_mutation_label" in data:
+            data.pop('client_mutation_label')
+
+        service = TaskService(user)
+        res = service.resolve_tasks(data)
+
+        if client_mutation_id:
+            # one mutation log lookup and one insert for the whole batch, as TaskMutation.object_mutated does per task
+            mutation_log = MutationLog.objects.filter(client_mutation_id=client_mutation_id, user=user).first()
+            if mutation_log:
+                task_ids = Task.objects.filter(id__in=data['ids']).values_list('id', flat=True)
+                TaskMutation.objects.bulk_create([
+                    TaskMutation(mutation=mutation_log, task_id=task_id) for task_id in task_ids
+                ])
+        if not res['success']:
+            return res
+        return None
+
+    class Input(ResolveTasksInput):
+        pass
@@ -1,5 +1,3 @@
-import importlib
-
 import graphene
 import copy
 
@@ -9,7 +7,11 @@ from graphene_django import DjangoObjectType
 from core import ExtendedConnection, prefix_filterset
 from core.gql_queries import UserGQLType
 from tasks_management.apps import TasksManagementConfig
+from tasks_management.business_data_cache import business_data_cache
+from tasks_management.gql_loaders import GenericEntityLoader, TaskGroupUsersLoader, get_request_loader, \
+    get_business_data_serializer
 from tasks_management.models import TaskGroup, TaskExecutor, Task
+from tasks_management.services import derive_business_status, derive_json_ext
 
 DICT_STRING = "{}"
 
@@ -21,8 +23,25 @@ def is_task_triage(user):
                           + TasksManagementConfig.gql_task_group_delete_perms)
 
 
+def filter_executor_tasks(queryset, user):
+    """
+    Tasks visible to an executor: accepted or closed tasks of the task groups the user executes. The groups are
+    selected by a subquery on the (user, task_group) index of TaskExecutor, so the tasks are neither joined with the
+    executors nor duplicated when a user is listed more than once in a group.
+    """
+    task_group_ids = TaskExecutor.objects.filter(user=user).values('task_group_id')
+    return queryset.filter(~Q(status=Task.Status.RECEIVED), task_group_id__in=task_group_ids, is_deleted=False)
+
+
+def _get_pending_votes(task):
+    # Uses votes prefetched by Query.resolve_task when available
+    return sorted((vote for vote in task.votes.all() if not vote.applied), key=lambda vote: vote.date_created)
+
+
 class TaskGQLType(DjangoObjectType):
     uuid = graphene.String(source='uuid')
+    business_status = graphene.JSONString()
+    json_ext = graphene.JSONString()
     business_data = graphene.JSONString()
     entity_string = graphene.String()
 
@@ -46,24 +65,30 @@ class TaskGQLType(DjangoObjectType):
         }
         connection_class = ExtendedConnection
 
+    def resolve_business_status(self, info):
+        return derive_business_status(self, _get_pending_votes(self))
+
+    def resolve_json_ext(self, info):
+        return derive_json_ext(self, _get_pending_votes(self))
+
     def resolve_business_data(self, info):
         data = self.data
         serializer_path = self.business_data_serializer
-        serialized_data = copy.deepcopy(data)
+        serialized_data = data
         if serializer_path:
-            module_path, class_name, method_name = serializer_path.rsplit('.', 2)
+            module_path = serializer_path.rsplit('.', 2)[0]
 
             try:
-                service_module = importlib.import_module(module_path)
-
-                if hasattr(service_module, class_name):
-                    service_class = getattr(service_module, class_name)
-                    instance = service_class(info.context.user)
+                serializer_method = get_business_data_serializer(info, serializer_path)
 
-                    serializer_method = getattr(instance, method_name, None)
+                if serializer_method:
+                    def render():
+                        if getattr(serializer_method, 'non_mutating', False):
+                            return serializer_method(data)
+                        return serializer_method(copy.deepcopy(data))
 
-                    if callable(serializer_method):
-                        serialized_data = serializer_method(serialized_data)
+                    serialized_data = business_data_cache.get_or_render(
+                        self, serializer_path, info.context.user, render)
 
             except ImportError:
                 return f"Error: Module '{module_path}' not found."
@@ -75,17 +100,21 @@ class TaskGQLType(DjangoObjectType):
         return serialized_data
 
     def resolve_entity_string(self, info):
-        return self.entity.__str__()
+        if self.entity_string is not None:
+            return self.entity_string
+        if not self.entity_type_id or not self.entity_id:
+            return self.entity.__str__()
+        # tasks created before entity_string was stored
+        return get_request_loader(info, GenericEntityLoader) \
+            .load((self.entity_type_id, self.entity_id)) \
+            .then(lambda entity: entity.__str__())
 
     @classmethod
     def get_queryset(cls, queryset, info):
         user = info.context.user
         if user.is_imis_admin or is_task_triage(user):
             return queryset.filter(is_deleted=False)
-        return queryset.filter(
-            Q(task_group__taskexecutor__user=user) & ~Q(status=Task.Status.RECEIVED),
-            is_deleted=False
-        )
+        return filter_executor_tasks(queryset, user)
 
 
 class TaskGroupGQLType(DjangoObjectType):
@@ -108,8 +137,7 @@ class TaskGroupGQLType(DjangoObjectType):
         connection_class = ExtendedConnection
 
     def resolve_user(self, info):
-        task_group_id = self.id
-        return TaskExecutor.objects.filter(task_group_id=task_group_id)
+        return get_request_loader(info, TaskGroupUsersLoader).load(self.id)
 
 
 class TaskExecutorGQLType(DjangoObjectType):
@@ -0,0 +1,87 @@
+import contextvars
+import uuid
+from contextlib import contextmanager
+
+from tasks_management.models import Task
+
+_task_identity_map = contextvars.ContextVar('tasks_management_task_identity_map', default=None)
+
+
+class TaskIdentityMap:
+    """
+    Holds Task instances loaded within a single flow (e.g. ResolveTaskMutation), so validation, services, signal
+    handlers and the mutation share one instance per row instead of reloading it at every step.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    def get(self, task_id):
+        key = self._key(task_id)
+        if key not in self._tasks:
+            self._tasks[key] = _load_task(task_id)
+        return self._tasks[key]
+
+    def get_many(self, task_ids):
+        keys = [self._key(task_id) for task_id in task_ids]
+        missing = [key for key in keys if key not in self._tasks]
+        if missing:
+            loaded = {self._key(task.id): task for task in _load_tasks(missing)}
+            self._tasks.update({key: loaded.get(key) for key in missing})
+        return [self._tasks[key] for key in keys]
+
+    def add(self, task):
+        self._tasks[self._key(task.id)] = task
+
+    @staticmethod
+    def _key(task_id):
+        try:
+            return task_id if isinstance(task_id, uuid.UUID) else uuid.UUID(str(task_id))
+        except ValueError:
+            return str(task_id)
+
+
+@contextmanager
+def task_identity_scope():
+    """
+    Opens a TaskIdentityMap for the enclosed block. Nested scopes reuse the outermost map. Can be used as a decorator.
+    """
+    identity_map = _task_identity_map.get()
+    if identity_map is not None:
+        yield identity_map
+        return
+
+    token = _task_identity_map.set(TaskIdentityMap())
+    try:
+        yield _task_identity_map.get()
+    finally:
+        _task_identity_map.reset(token)
+
+
+def get_task(task_id):
+    """
+    Returns the Task (with task_group) for the given id, taken from the current identity map if a scope is open.
+    Returns None if the task does not exist.
+    """
+    identity_map = _task_identity_map.get()
+    if identity_map is None:
+        return _load_task(task_id)
+    return identity_map.get(task_id)
+
+
+def get_tasks(task_ids):
+    """
+    Returns the existing Tasks (with task_group) for the given ids, loading the ones missing from the current identity
+    map in a single query.
+    """
+    identity_map = _task_identity_map.get()
+    tasks = identity_map.get_many(task_ids) if identity_map is not None else _load_tasks(task_ids)
+    return [task for task in tasks if task is not None]
+
+
+def _load_task(task_id):
+    return Task.objects.select_related('task_group').filter(id=task_id).first()
+
+
+def _load_tasks(task_ids):
+    return list(Task.objects.select_related('task_group').filter(id__in=task_ids))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from tasks_management.models import Task
+from tasks_management.utils import load_generic_entities, get_entity_string
+
+
+class Command(BaseCommand):
+    help = "Fills Task.entity_string (used by the entityString__Icontains filter) from the entities of the tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help="Number of tasks loaded and updated at once.")
+        parser.add_argument('--all', action='store_true',
+                            help="Recompute entity_string of all tasks, not only of the ones without it.")
+
+    def handle(self, *args, **options):
+        queryset = Task.objects.filter(entity_type__isnull=False, entity_id__isnull=False)
+        if not options['all']:
+            queryset = queryset.filter(entity_string__isnull=True)
+        queryset = queryset.only('id', 'entity_type_id', 'entity_id', 'entity_string').order_by('id')
+
+        updated = 0
+        last_id = None
+        while True:
+            batch = queryset.filter(id__gt=last_id) if last_id else queryset
+            tasks = list(batch[:options['batch_size']])
+            if not tasks:
+                break
+            entities = load_generic_entities((task.entity_type_id, task.entity_id) for task in tasks)
+            for task in tasks:
+                task.entity_string = get_entity_string(entities.get((task.entity_type_id, str(task.entity_id))))
+            Task.objects.bulk_update(tasks, ['entity_string'])
+            updated += len(tasks)
+            last_id = tasks[-1].id
+            self.stdout.write(f"Updated entity_string of {updated} tasks")
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tasks_management.resolution_jobs import process_task_resolution_jobs, get_task_resolution_backlog
+
+
+class Command(BaseCommand):
+    help = "Evaluates the completion policy of resolved tasks queued when `deferred_task_resolution` is enabled."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help="Maximum number of jobs processed in one run (per iteration with --loop).")
+        parser.add_argument('--loop', action='store_true',
+                            help="Keep polling the queue instead of exiting once it is drained.")
+        parser.add_argument('--sleep', type=float, default=5,
+                            help="Seconds to wait between polls when the queue is empty (with --loop).")
+        parser.add_argument('--stats', action='store_true',
+                            help="Print the job backlog and exit.")
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            for key, value in get_task_resolution_backlog().items():
+                self.stdout.write(f"{key}: {value}")
+            return
+
+        while True:
+            processed = process_task_resolution_jobs(options['batch_size'])
+            if processed:
+                self.stdout.write(f"Processed {processed} task resolution jobs")
+            if not options['loop']:
+                return
+            if processed < options['batch_size']:
+                time.sleep(options['sleep'])
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def populate_task_source_routes(apps, schema_editor):
+    TaskGroup = apps.get_model('tasks_management', 'TaskGroup')
+    TaskSourceRoute = apps.get_model('tasks_management', 'TaskSourceRoute')
+
+    routes = {}
+    for task_group_id, json_ext in TaskGroup.objects.filter(is_deleted=False).values_list('id', 'json_ext'):
+        for source in (json_ext or {}).get('task_sources', []):
+            routes.setdefault(source, task_group_id)
+
+    TaskSourceRoute.objects.bulk_create(
+        [TaskSourceRoute(source=source, task_group_id=task_group_id) for source, task_group_id in routes.items()]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0011_historicaltaskgroup_task_allowed_sources_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSourceRoute',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('source', models.CharField(max_length=255, unique=True)),
+                ('task_group', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='source_routes', to='tasks_management.taskgroup')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(populate_task_source_routes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0012_tasksourceroute'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status__in', ['RECEIVED', 'ACCEPTED'])), fields=['entity_type', 'entity_id'], name='task_pending_entity_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('tasks_management', '0013_task_pending_entity_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskVote',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('business_status', models.JSONField(blank=True, default=dict)),
+                ('additional_data', models.JSONField(blank=True, null=True)),
+                ('applied', models.BooleanField(default=False)),
+                ('date_created', models.DateTimeField(auto_now_add=True)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='votes', to='tasks_management.task')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['task', 'user', 'date_created'], name='task_vote_task_user_idx')],
+            },
+        ),
+    ]
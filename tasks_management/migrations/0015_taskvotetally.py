@@ -0,0 +1,26 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0014_taskvote'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskvote',
+            name='decision',
+            field=models.CharField(blank=True, choices=[('APPROVED', 'Approved'), ('FAILED', 'Failed')], max_length=50, null=True),
+        ),
+        migrations.CreateModel(
+            name='TaskVoteTally',
+            fields=[
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='vote_tally', serialize=False, to='tasks_management.task')),
+                ('approved', models.IntegerField(default=0)),
+                ('failed', models.IntegerField(default=0)),
+                ('executors', models.IntegerField(default=0)),
+            ],
+        ),
+    ]
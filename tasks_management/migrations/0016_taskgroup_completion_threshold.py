@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0015_taskvotetally'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicaltaskgroup',
+            name='completion_threshold',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicaltaskgroup',
+            name='completion_threshold_type',
+            field=models.CharField(choices=[('ABSOLUTE', 'Absolute'), ('PERCENTAGE', 'Percentage')], default='ABSOLUTE', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='taskgroup',
+            name='completion_threshold',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='taskgroup',
+            name='completion_threshold_type',
+            field=models.CharField(choices=[('ABSOLUTE', 'Absolute'), ('PERCENTAGE', 'Percentage')], default='ABSOLUTE', max_length=50),
+        ),
+    ]
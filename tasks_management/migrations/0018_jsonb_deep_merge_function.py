@@ -0,0 +1,47 @@
+from django.db import migrations
+
+CREATE_DEEP_MERGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION tasks_management_jsonb_deep_merge(target jsonb, source jsonb)
+RETURNS jsonb LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    result jsonb := COALESCE(target, '{}'::jsonb);
+    item record;
+BEGIN
+    FOR item IN SELECT key, value FROM jsonb_each(COALESCE(source, '{}'::jsonb)) LOOP
+        IF jsonb_typeof(result -> item.key) = 'object' AND jsonb_typeof(item.value) = 'object' THEN
+            result := jsonb_set(result, ARRAY[item.key],
+                                tasks_management_jsonb_deep_merge(result -> item.key, item.value));
+        ELSIF jsonb_typeof(result -> item.key) = 'array' AND jsonb_typeof(item.value) = 'array' THEN
+            result := jsonb_set(result, ARRAY[item.key], (result -> item.key) || item.value);
+        ELSE
+            result := result || jsonb_build_object(item.key, item.value);
+        END IF;
+    END LOOP;
+    RETURN result;
+END;
+$$;
+"""
+
+DROP_DEEP_MERGE_FUNCTION = "DROP FUNCTION IF EXISTS tasks_management_jsonb_deep_merge(jsonb, jsonb);"
+
+
+def create_deep_merge_function(apps, schema_editor):
+    # The function is only used by the `database` business_status_merge_mode, available on PostgreSQL
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_DEEP_MERGE_FUNCTION)
+
+
+def drop_deep_merge_function(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_DEEP_MERGE_FUNCTION)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0017_taskresolutionjob'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_deep_merge_function, drop_deep_merge_function),
+    ]
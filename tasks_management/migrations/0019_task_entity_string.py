@@ -0,0 +1,49 @@
+import logging
+
+from django.db import migrations, models, transaction
+
+logger = logging.getLogger(__name__)
+
+ENTITY_STRING_TRGM_INDEX = 'task_entity_string_trgm_idx'
+
+
+def create_entity_string_trgm_index(apps, schema_editor):
+    # Backs the entityString__Icontains filter, Django compiles icontains to UPPER("entity_string"::text) LIKE UPPER(%s)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except Exception as exc:
+        logger.warning("pg_trgm extension could not be created, %s is not created: %s", ENTITY_STRING_TRGM_INDEX, exc)
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {ENTITY_STRING_TRGM_INDEX} ON tasks_management_task '
+        f'USING gin ((UPPER("entity_string"::text)) gin_trgm_ops)'
+    )
+
+
+def drop_entity_string_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {ENTITY_STRING_TRGM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0018_jsonb_deep_merge_function'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicaltask',
+            name='entity_string',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='entity_string',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.RunPython(create_entity_string_trgm_index, drop_entity_string_trgm_index),
+    ]
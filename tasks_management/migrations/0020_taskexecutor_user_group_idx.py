@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_management', '0019_task_entity_string'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskexecutor',
+            index=models.Index(fields=['user', 'task_group'], name='task_executor_user_group_idx'),
+        ),
+    ]
@@ -1,7 +1,9 @@
 from django.db import models
+from django.db.models import Q
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from core.models import HistoryModel, User, UUIDModel, ObjectMutation, MutationLog
@@ -13,17 +15,41 @@ class TaskGroup(HistoryModel):
         ANY = 'ANY', _('ANY')
         N = 'N', _('N')
 
+    class TaskGroupCompletionThresholdType(models.TextChoices):
+        ABSOLUTE = 'ABSOLUTE', _('Absolute')
+        PERCENTAGE = 'PERCENTAGE', _('Percentage')
+
     code = models.CharField(max_length=255, null=False, blank=False)
     completion_policy = models.CharField(
         max_length=50, choices=TaskGroupCompletionPolicy.choices, null=False, blank=False
     )
+    # Approvals required by the N completion policy, either a number of executors or a percentage of them
+    completion_threshold = models.IntegerField(blank=True, null=True)
+    completion_threshold_type = models.CharField(
+        max_length=50, choices=TaskGroupCompletionThresholdType.choices,
+        default=TaskGroupCompletionThresholdType.ABSOLUTE
+    )
     task_allowed_sources = models.JSONField(blank=True, null=True)
 
 
+class TaskSourceRoute(UUIDModel):
+    """
+    Routing table for TaskService.create, mapping a task source to the TaskGroup handling it. Kept in sync with
+    `TaskGroup.json_ext['task_sources']` by TaskGroupService.
+    """
+    source = models.CharField(max_length=255, unique=True)
+    task_group = models.ForeignKey(TaskGroup, models.DO_NOTHING, related_name='source_routes')
+
+
 class TaskExecutor(HistoryModel):
     user = models.ForeignKey(User, on_delete=models.DO_NOTHING, null=False)
     task_group = models.ForeignKey(TaskGroup, on_delete=models.DO_NOTHING, null=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'task_group'], name='task_executor_user_group_idx'),
+        ]
+
 
 class Task(HistoryModel):
     class Status(models.TextChoices):
@@ -43,6 +69,95 @@ class Task(HistoryModel):
     task_group = models.ForeignKey(TaskGroup, on_delete=models.DO_NOTHING,  blank=True, null=True)
     data = models.JSONField(blank=True, default=dict)
     business_data_serializer = models.CharField(max_length=255, blank=True, null=True)
+    # str() of the entity, kept for searching tasks by entity, see the backfill_task_entity_string command
+    entity_string = models.TextField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['entity_type', 'entity_id'], name='task_pending_entity_idx',
+                         condition=Q(status__in=['RECEIVED', 'ACCEPTED'])),
+            models.Index(fields=['date_created', 'id'], name='task_date_created_id_idx'),
+            # task group and status filters of the task list, also the tasks of the executor's task groups
+            # (TaskGQLType.get_queryset for non triage users), ordered by date_created
+            models.Index(fields=['task_group', 'status', 'date_created'], name='task_open_group_status_idx',
+                         condition=Q(is_deleted=False)),
+            models.Index(fields=['entity_id'], name='task_entity_id_idx'),
+            models.Index(fields=['source'], name='task_source_idx', condition=Q(is_deleted=False)),
+            models.Index(fields=['business_event'], name='task_business_event_idx', condition=Q(is_deleted=False)),
+            models.Index(fields=['executor_action_event'], name='task_executor_event_idx',
+                         condition=Q(is_deleted=False)),
+            models.Index(fields=['date_updated'], name='task_date_updated_idx'),
+        ]
+
+
+class TaskVote(UUIDModel):
+    """
+    Append-only record of executor decisions on a task. Task.business_status is derived by merging the votes not yet
+    applied over the stored business_status, votes are applied to the task row when the task is completed.
+    """
+    class Decision(models.TextChoices):
+        APPROVED = 'APPROVED', _('Approved')
+        FAILED = 'FAILED', _('Failed')
+
+    task = models.ForeignKey(Task, models.DO_NOTHING, related_name='votes')
+    user = models.ForeignKey(User, models.DO_NOTHING)
+    business_status = models.JSONField(blank=True, default=dict)
+    additional_data = models.JSONField(blank=True, null=True)
+    decision = models.CharField(max_length=50, choices=Decision.choices, blank=True, null=True)
+    applied = models.BooleanField(default=False)
+    date_created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'user', 'date_created'], name='task_vote_task_user_idx'),
+        ]
+
+
+class TaskVoteTally(models.Model):
+    """
+    Decision counters of a task, updated together with every TaskVote (the latest vote of each user counts) so
+    completion policies can be evaluated without rescanning the votes. `executors` caches the number of executors of
+    the task group.
+    """
+    task = models.OneToOneField(Task, models.DO_NOTHING, primary_key=True, related_name='vote_tally')
+    approved = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    executors = models.IntegerField(default=0)
+
+    @property
+    def pending(self):
+        return max(self.executors - self.approved - self.failed, 0)
+
+    def count_decision(self, decision, delta=1):
+        if decision == TaskVote.Decision.APPROVED:
+            self.approved += delta
+        elif decision == TaskVote.Decision.FAILED:
+            self.failed += delta
+
+
+class TaskResolutionJob(UUIDModel):
+    """
+    Queued completion policy evaluation of a resolved task, used when `deferred_task_resolution` is enabled.
+    Processed by the `process_task_resolution_jobs` management command.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', _('Pending')
+        COMPLETED = 'COMPLETED', _('Completed')
+        FAILED = 'FAILED', _('Failed')
+
+    task = models.ForeignKey(Task, models.DO_NOTHING, related_name='resolution_jobs')
+    user = models.ForeignKey(User, models.DO_NOTHING)
+    status = models.CharField(max_length=50, choices=Status.choices, default=Status.PENDING)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_available = models.DateTimeField(default=timezone.now)
+    date_processed = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'date_available'], name='task_res_job_status_idx'),
+        ]
 
 
 class TaskMutation(UUIDModel, ObjectMutation):
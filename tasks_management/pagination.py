@@ -0,0 +1,106 @@
+import base64
+import datetime
+import json
+import uuid
+
+import graphene
+from django.db import connections
+from django.db.models import F, Q
+from graphene.relay import PageInfo
+from graphql import GraphQLError
+
+from core.schema import OrderedDjangoFilterConnectionField
+
+
+def encode_keyset_cursor(node):
+    value = {'date_created': node.date_created.isoformat() if node.date_created else None, 'id': str(node.id)}
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+def decode_keyset_cursor(cursor):
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        date_created = value['date_created']
+        if date_created is not None:
+            date_created = datetime.datetime.fromisoformat(date_created)
+        return date_created, str(uuid.UUID(value['id']))
+    except (ValueError, TypeError, KeyError, AttributeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def filter_after_keyset_cursor(queryset, date_created, id_):
+    """
+    Rows following the cursor in the (-date_created NULLS FIRST, -id) order.
+    """
+    if date_created is None:
+        return queryset.filter(Q(date_created__isnull=True, id__lt=id_) | Q(date_created__isnull=False))
+    return queryset.filter(Q(date_created__lt=date_created) | Q(date_created=date_created, id__lt=id_))
+
+
+def estimate_count(queryset):
+    """
+    Row count estimated by the PostgreSQL planner (EXPLAIN), exact count on other databases.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetDjangoFilterConnectionField(OrderedDjangoFilterConnectionField):
+    """
+    OrderedDjangoFilterConnectionField with an optional keyset pagination mode (`keyset: true`). Pages are ordered on
+    (-date_created, -id) and continued with a WHERE condition on the cursor of the last row instead of OFFSET, so deep
+    pages cost the same as the first one. Only `first`/`after` are supported in this mode, `orderBy`, `offset`, `last`
+    and `before` are rejected. Rows without date_created come first, as in a backward scan of the (date_created, id)
+    index on PostgreSQL. `totalCount` is estimated by the database planner unless `exactCount: true` is passed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('keyset', graphene.Boolean())
+        kwargs.setdefault('exactCount', graphene.Boolean())
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def resolve_connection(cls, connection, args, iterable, max_limit=None, user=None):
+        if not args.get('keyset'):
+            return super().resolve_connection(connection, args, iterable, max_limit=max_limit, user=user)
+
+        if args.get('offset') is not None or any(args.get(arg) for arg in ('last', 'before', 'orderBy')):
+            raise GraphQLError("Keyset pagination supports only `first` and `after`, without `offset` or `orderBy`")
+
+        queryset = iterable.order_by(F('date_created').desc(nulls_first=True), '-id')
+        count = queryset.count() if args.get('exactCount') else estimate_count(queryset)
+
+        after = args.get('after')
+        if after:
+            try:
+                date_created, id_ = decode_keyset_cursor(after)
+            except ValueError as exc:
+                raise GraphQLError(str(exc)) from exc
+            queryset = filter_after_keyset_cursor(queryset, date_created, id_)
+
+        limit = min(filter(None, [args.get('first'), max_limit]), default=None)
+        nodes = list(queryset[:limit + 1] if limit else queryset)
+        has_next_page = bool(limit) and len(nodes) > limit
+        nodes = nodes[:limit] if limit else nodes
+
+        edges = [connection.Edge(node=node, cursor=encode_keyset_cursor(node)) for node in nodes]
+        connection = connection(
+            edges=edges,
+            page_info=PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=bool(after),
+                has_next_page=has_next_page,
+            ),
+        )
+        connection.iterable = iterable
+        connection.length = count
+        return connection
@@ -0,0 +1,90 @@
+import datetime
+import logging
+
+from django.db import connection, transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from tasks_management.apps import TasksManagementConfig
+from tasks_management.models import Task, TaskResolutionJob, TaskVoteTally
+from tasks_management.services import TaskService
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task_resolution(task, user):
+    return TaskResolutionJob.objects.create(task_id=task.id, user=user)
+
+
+def enqueue_task_resolutions(tasks, user):
+    return TaskResolutionJob.objects.bulk_create([TaskResolutionJob(task_id=task.id, user=user) for task in tasks])
+
+
+def process_task_resolution_jobs(batch_size=100):
+    """
+    Processes up to batch_size pending jobs, each one in its own transaction with the job row locked, so several
+    workers can drain the queue concurrently. Failed jobs are retried after a delay until the max attempts is reached.
+    Returns the number of processed jobs.
+    """
+    processed = 0
+    while processed < batch_size:
+        with transaction.atomic():
+            job = _lock_next_job()
+            if not job:
+                break
+            _process_job(job)
+        processed += 1
+    return processed
+
+
+def get_task_resolution_backlog():
+    """
+    Number of jobs per status and the creation date of the oldest pending job.
+    """
+    counts = dict(TaskResolutionJob.objects.values_list('status').annotate(count=Count('id')).order_by())
+    oldest_pending = TaskResolutionJob.objects \
+        .filter(status=TaskResolutionJob.Status.PENDING) \
+        .aggregate(oldest=Min('date_created'))['oldest']
+    return {
+        **{status: counts.get(status, 0) for status in TaskResolutionJob.Status.values},
+        'oldest_pending': oldest_pending,
+    }
+
+
+def _lock_next_job():
+    queryset = TaskResolutionJob.objects \
+        .filter(status=TaskResolutionJob.Status.PENDING, date_available__lte=timezone.now()) \
+        .order_by('date_created')
+    skip_locked = connection.features.has_select_for_update_skip_locked
+    return queryset.select_for_update(skip_locked=skip_locked).first()
+
+
+def _process_job(job):
+    job.attempts += 1
+    try:
+        with transaction.atomic():
+            _resolve_task(job)
+        job.status = TaskResolutionJob.Status.COMPLETED
+        job.last_error = None
+    except Exception as exc:
+        logger.error("Error while processing task resolution job %s", job.id, exc_info=exc)
+        job.last_error = str(exc)
+        if job.attempts >= TasksManagementConfig.task_resolution_job_max_attempts:
+            job.status = TaskResolutionJob.Status.FAILED
+        else:
+            job.date_available = timezone.now() + datetime.timedelta(
+                seconds=TasksManagementConfig.task_resolution_job_retry_delay_seconds)
+    job.date_processed = timezone.now()
+    job.save()
+
+
+def _resolve_task(job):
+    # the task row is locked so concurrent jobs of the same task are serialized and only the first one completes it
+    task = Task.objects.select_for_update().get(id=job.task_id)
+    if task.status != Task.Status.ACCEPTED:
+        # already completed, e.g. by an earlier job of the same task
+        return
+    tally = TaskVoteTally.objects.get(task_id=task.id)
+    output = TaskService(job.user).complete_if_policy_met(task, tally)
+    if output and not output['success']:
+        raise ValueError(output['detail'])
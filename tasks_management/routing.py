@@ -0,0 +1,88 @@
+import logging
+import threading
+import uuid
+from typing import Dict, NamedTuple, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from tasks_management.models import TaskSourceRoute
+
+logger = logging.getLogger(__name__)
+
+ROUTING_VERSION_CACHE_KEY = 'tasks_management.task_source_routing.version'
+
+
+class TaskSourceRouteEntry(NamedTuple):
+    task_group_id: uuid.UUID
+    completion_policy: str
+
+
+class TaskSourceRoutingCache:
+    """
+    Process-local copy of the TaskSourceRoute table used by TaskService.create. The table is loaded lazily in a single
+    query and reused until the shared version stamp (stored in the django cache) changes. TaskGroupService bumps the
+    stamp on every create/update/delete so all workers reload their copy on the next lookup.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        # set by invalidate until the transaction commits, routes read meanwhile may be rolled back
+        self._invalidated = False
+        self._routes: Dict[str, TaskSourceRouteEntry] = {}
+
+    def get(self, source) -> Optional[TaskSourceRouteEntry]:
+        if not source:
+            return None
+        if self._invalidated and transaction.get_connection().in_atomic_block:
+            # the shared version is only bumped on commit, so uncommitted routes are not cached under the current one
+            return self._load_routes(source).get(source)
+        version = self._get_shared_version()
+        if version is None or version != self._version:
+            # Without a working cache backend the version stamp is never stored and routes are read on every call
+            with self._lock:
+                if version is None or version != self._version:
+                    self._routes = self._load_routes()
+                    self._version = version
+                    self._invalidated = False
+        return self._routes.get(source)
+
+    def invalidate(self):
+        """
+        Drops the local copy immediately and bumps the shared version stamp once the current transaction commits,
+        so other workers do not reload uncommitted routes. Until then routes are read without being cached, so a
+        rollback does not leave uncommitted routes in the local copy.
+        """
+        self._version = None
+        self._invalidated = True
+        transaction.on_commit(self._on_commit)
+
+    def _on_commit(self):
+        self._invalidated = False
+        self._version = None
+        self._bump_shared_version()
+
+    @staticmethod
+    def _load_routes(source=None):
+        routes = TaskSourceRoute.objects.filter(task_group__is_deleted=False)
+        if source:
+            routes = routes.filter(source=source)
+        routes = routes.values_list('source', 'task_group_id', 'task_group__completion_policy')
+        return {source: TaskSourceRouteEntry(task_group_id, completion_policy)
+                for source, task_group_id, completion_policy in routes}
+
+    @staticmethod
+    def _get_shared_version():
+        version = cache.get(ROUTING_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(ROUTING_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+            version = cache.get(ROUTING_VERSION_CACHE_KEY)
+        return version
+
+    @staticmethod
+    def _bump_shared_version():
+        cache.set(ROUTING_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+task_source_routing_cache = TaskSourceRoutingCache()
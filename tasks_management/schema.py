@@ -3,15 +3,16 @@ import json
 import graphene_django_optimizer as gql_optimizer
 
 from django.contrib.auth.models import AnonymousUser
-from django.db.models import Q
+from django.db.models import Q, Prefetch
 
 from core.schema import OrderedDjangoFilterConnectionField
 from core.utils import append_validity_filter
 from tasks_management.gql_mutations import CreateTaskGroupMutation, UpdateTaskGroupMutation, DeleteTaskGroupMutation, \
-    UpdateTaskMutation, ResolveTaskMutation
+    UpdateTaskMutation, ResolveTaskMutation, ResolveTasksMutation
 from tasks_management.gql_queries import TaskGroupGQLType, TaskExecutorGQLType, TaskGQLType
-from tasks_management.models import TaskGroup, TaskExecutor, Task
+from tasks_management.models import TaskGroup, TaskExecutor, Task, TaskVote
 from tasks_management.apps import TasksManagementConfig
+from tasks_management.pagination import KeysetDjangoFilterConnectionField
 
 
 class Query(graphene.ObjectType):
@@ -34,7 +35,7 @@ class Query(graphene.ObjectType):
         taskGroupIdString=graphene.String(),
     )
 
-    task = OrderedDjangoFilterConnectionField(
+    task = KeysetDjangoFilterConnectionField(
         TaskGQLType,
         orderBy=graphene.List(of_type=graphene.String),
         applyDefaultValidityFilter=graphene.Boolean(),
@@ -61,13 +62,13 @@ class Query(graphene.ObjectType):
         if entityIds:
             filters.append(Q(entity_id__in=entityIds))
 
-        # not checking perms because get_queryset filters tasks assigned to user
-        query = Task.objects.filter(*filters)
-
         entity_string = kwargs.get("entityString__Icontains")
         if entity_string:
-            task_ids = [task.id for task in query if entity_string.lower() in str(task.entity).lower()]
-            query = query.filter(id__in=task_ids)
+            filters.append(Q(entity_string__icontains=entity_string))
+
+        # not checking perms because get_queryset filters tasks assigned to user
+        query = Task.objects.filter(*filters).prefetch_related(
+            Prefetch('votes', queryset=TaskVote.objects.filter(applied=False).order_by('date_created')))
 
         return gql_optimizer.query(query, info)
 
@@ -117,3 +118,4 @@ class Mutation(graphene.ObjectType):
 
     update_task = UpdateTaskMutation.Field()
     resolve_task = ResolveTaskMutation.Field()
+    resolve_tasks = ResolveTasksMutation.Field()
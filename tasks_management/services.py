@@ -1,22 +1,33 @@
 import copy
 import datetime
 import decimal
+import json
 import logging
 import uuid
 from abc import abstractmethod, ABC
+from collections import defaultdict
 from typing import Dict, Type
 from django.contrib.contenttypes.models import ContentType
-from django.db import transaction
-
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction, IntegrityError, connection
+from django.db.models import Count, F
+from simple_history.utils import bulk_create_with_history
+
 from core.datetimes.ad_datetime import AdDate, AdDatetime
-from core.forms import User
 from core.services import BaseService
-from core.signals import register_service_signal
+from core.signals import register_service_signal, REGISTERED_SERVICE_SIGNALS
 from core.services.utils import check_authentication, output_exception, output_result_success, model_representation
 from tasks_management.apps import TasksManagementConfig
-from tasks_management.models import TaskGroup, TaskExecutor, Task
-from tasks_management.validation import TaskGroupValidation, TaskExecutorValidation, TaskValidation
+from tasks_management.completion_policy import evaluate_completion_policy
+from tasks_management.dispatch import business_event_registry, on_task_complete_business_event, \
+    COMPLETE_TASKS_CONTEXT
+from tasks_management.identity_map import get_task, get_tasks, task_identity_scope
+from tasks_management.models import TaskGroup, TaskExecutor, Task, TaskSourceRoute, TaskVote, TaskVoteTally
+from tasks_management.routing import task_source_routing_cache
+from tasks_management.utils import load_generic_entities, get_entity_string
+from tasks_management.validation import TaskGroupValidation, TaskExecutorValidation, TaskValidation, \
+    validate_task_instance_status
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +40,15 @@ non_serializable_types = (
 )
 
 
+def non_mutating_serializer(serializer):
+    """
+    Marks a business_data_serializer that does not modify the data passed to it, TaskGQLType.business_data then passes
+    the task data without copying it first.
+    """
+    serializer.non_mutating = True
+    return serializer
+
+
 class TaskService(BaseService):
     OBJECT_TYPE = Task
 
@@ -38,14 +58,50 @@ class TaskService(BaseService):
     @transaction.atomic
     @register_service_signal('task_service.create')
     def create(self, obj_data):
-        source = obj_data.get('source')
-        task_group_query = TaskGroup.objects.filter(json_ext__contains={"task_sources": [source]})
-        if task_group_query.exists():
-            obj_data = {**obj_data, "task_group": task_group_query.first(), "status": Task.Status.ACCEPTED}
-        return super().create(obj_data)
+        route = task_source_routing_cache.get(obj_data.get('source'))
+        if route:
+            obj_data = {**obj_data, "task_group_id": route.task_group_id, "status": Task.Status.ACCEPTED}
+        return super().create(with_entity_string(obj_data))
+
+    @register_service_signal('task_service.bulk_create')
+    @check_authentication
+    def bulk_create(self, objs_data):
+        """
+        Creates many tasks in a constant number of queries. Validation and routing are done for the whole batch,
+        Task and HistoricalTask rows are inserted with bulk_create and a single signal is sent for the batch.
+        """
+        try:
+            with transaction.atomic():
+                objs_data = [self._adjust_create_payload(obj_data) for obj_data in objs_data]
+                # entities are loaded once, for validation and for entity_string
+                entities = load_generic_entities(_get_entity_reference(obj_data) for obj_data in objs_data)
+                self.validation_class.validate_bulk_create(self.user, objs_data, entities)
+                now = datetime.datetime.now()
+                tasks = [self._build_task(with_entity_string(obj_data, entities), now) for obj_data in objs_data]
+                tasks = bulk_create_with_history(tasks, self.OBJECT_TYPE, default_user=self.user)
+                return output_result_success({
+                    'tasks': [model_representation(task) for task in tasks],
+                    'user': {'id': f"{self.user.id}"}
+                })
+        except Exception as exc:
+            return output_exception(model_name=self.OBJECT_TYPE.__name__, method="bulk_create", exception=exc)
+
+    def _build_task(self, obj_data, now):
+        route = task_source_routing_cache.get(obj_data.get('source'))
+        if route:
+            obj_data = {**obj_data, "task_group_id": route.task_group_id, "status": Task.Status.ACCEPTED}
+        task = self.OBJECT_TYPE(**obj_data)
+        task.set_pk()
+        task.user_created = self.user
+        task.user_updated = self.user
+        task.date_created = now
+        task.date_updated = now
+        return task
 
     @register_service_signal('task_service.update')
     def update(self, obj_data):
+        if any(field in obj_data for field in ('entity', 'entity_type', 'entity_type_id', 'entity_id')):
+            obj_data = with_entity_string(obj_data)
         return super().update(obj_data)
 
     @register_service_signal('task_service.delete')
@@ -56,61 +112,322 @@ class TaskService(BaseService):
     def complete_task(self, obj_data):
         try:
             with transaction.atomic():
-                obj = self.OBJECT_TYPE.objects.get(id=obj_data['id'])
+                obj = self._lock_open_task(obj_data['id'])
+                votes = self._apply_pending_votes(obj)
                 obj.status = Task.Status.FAILED if obj_data.get('failed', False) else Task.Status.COMPLETED
                 obj.save(username=self.user.login_name)
+                TaskVote.objects.filter(id__in=[vote.id for vote in votes]).update(applied=True)
                 return output_result_success({'task': model_representation(obj), 'user': {'id': f"{self.user.id}"}})
         except Exception as exc:
             return output_exception(model_name=self.OBJECT_TYPE.__name__, method="complete", exception=exc)
 
+    @register_service_signal('task_service.complete_tasks')
+    def complete_tasks(self, obj_data):
+        """
+        Completes (or fails, with `failed`) many tasks at once. Pending votes are applied with one bulk_update, the
+        status is changed with a single UPDATE and history rows are inserted in bulk. Tasks already completed or failed
+        are skipped.
+        The task_service.complete_task AFTER signal is still sent for each task (with the COMPLETE_TASKS_CONTEXT
+        context), then task_service.complete_tasks once for the batch.
+        """
+        try:
+            with transaction.atomic():
+                failed = obj_data.get('failed', False)
+                status = Task.Status.FAILED if failed else Task.Status.COMPLETED
+                tasks = [task for task in get_tasks(list(dict.fromkeys(obj_data['ids'])))
+                         if task.status not in (Task.Status.COMPLETED, Task.Status.FAILED)]
+                tasks = self._complete_tasks(tasks, status)
+            self._send_complete_task_signals(tasks, failed)
+            return output_result_success({
+                'tasks': [model_representation(task) for task in tasks],
+                'user': {'id': f"{self.user.id}"},
+            })
+        except Exception as exc:
+            return output_exception(model_name=self.OBJECT_TYPE.__name__, method="complete_tasks", exception=exc)
+
+    def _complete_tasks(self, tasks, status):
+        open_ids = set(Task.objects
+                       .select_for_update()
+                       .filter(id__in=[task.id for task in tasks])
+                       .exclude(status__in=[Task.Status.COMPLETED, Task.Status.FAILED])
+                       .values_list('id', flat=True))
+        tasks = [task for task in tasks if task.id in open_ids]
+        if not tasks:
+            return tasks
+
+        self._apply_pending_votes_in_bulk(tasks, get_pending_votes_by_task(tasks))
+
+        now = datetime.datetime.now()
+        Task.objects.filter(id__in=open_ids).update(
+            status=status, version=F('version') + 1, date_updated=now, user_updated=self.user)
+        for task in tasks:
+            task.status = status
+            task.version += 1
+            task.date_updated = now
+            task.user_updated = self.user
+        Task.history.bulk_history_create(tasks, update=True, default_user=self.user)
+        Task.bulk_update_cache(tasks)
+        return tasks
+
+    def _send_complete_task_signals(self, tasks, failed):
+        signal = REGISTERED_SERVICE_SIGNALS['task_service.complete_task']
+        for task in tasks:
+            signal.send_signal_after(
+                sender=self, cls_=self, data=[({'id': task.id, 'failed': failed},), {}],
+                context=COMPLETE_TASKS_CONTEXT,
+                result=output_result_success({'task': model_representation(task), 'user': {'id': f"{self.user.id}"}}))
+
+    def complete_tasks_if_policy_met(self, tasks, tallies):
+        """
+        Batch counterpart of complete_if_policy_met, tallies are keyed by task id. The tasks meeting their completion
+        policy are completed (or failed) with complete_tasks, returns the complete_tasks outputs.
+        """
+        ids_by_status = defaultdict(list)
+        for task in tasks:
+            status = evaluate_completion_policy(task.task_group, tallies[task.id])
+            if status:
+                ids_by_status[status].append(task.id)
+        return [self.complete_tasks({'ids': ids, 'failed': status == Task.Status.FAILED})
+                for status, ids in ids_by_status.items()]
+
+    def complete_if_policy_met(self, task, tally):
+        """
+        Completes (or fails) the task if its vote tally meets the completion policy of its task group.
+        Returns the complete_task output, or None if the task is still pending.
+        """
+        status = evaluate_completion_policy(task.task_group, tally)
+        if not status:
+            return None
+        return self.complete_task({'id': task.id, 'failed': status == Task.Status.FAILED})
+
+    @task_identity_scope()
     @register_service_signal('task_service.resolve_task')
     def resolve_task(self, obj_data):
         try:
-            self.validation_class.validate_update(self.user, **obj_data)
-            obj = self.OBJECT_TYPE.objects.get(id=obj_data['id'])
-            incoming_status = obj_data.get('business_status')
-            additional_data = obj_data.get('additional_data')
-            self._update_task_business_status(obj, incoming_status, additional_data)
-            self._insert_additional_data_to_json_ext(obj, additional_data)
-            return output_result_success({'task': model_representation(obj), 'user': {'id': f"{self.user.id}"}})
+            with transaction.atomic():
+                self.validation_class.validate_update(self.user, **obj_data)
+                obj = self._get_task(obj_data['id'])
+                tally = self._add_vote(obj, obj_data.get('business_status'), obj_data.get('additional_data'))
+                return output_result_success({
+                    'task': self._task_representation(obj),
+                    'user': {'id': f"{self.user.id}"},
+                    'tally': {'approved': tally.approved, 'failed': tally.failed, 'executors': tally.executors},
+                })
         except Exception as exc:
             return output_exception(model_name=self.OBJECT_TYPE.__name__, method="resolve", exception=exc)
 
-    def _update_task_business_status(self, task, incoming_status, additional_data):
+    @task_identity_scope()
+    @register_service_signal('task_service.resolve_tasks')
+    def resolve_tasks(self, obj_data):
+        """
+        Resolves many tasks with the same business_status and additional_data. Tasks, vote tallies and previous votes
+        are loaded for the whole batch, votes are inserted with bulk_create and changed tallies saved with bulk_update,
+        and the task_service.resolve_tasks signal is sent once for the batch.
+        """
         try:
-            task.business_status = self.__deep_merge(task.business_status, incoming_status)
-            self._insert_additional_data_to_json_ext(task, additional_data)
-            task.save(username=self.user.login_name)
-        except ValidationError as e:
-            if e.message == 'Record has not be updated - there are no changes in fields':
-                return None
-
-    def _insert_additional_data_to_json_ext(self, obj, additional_data):
-        if not additional_data:
-            return
-
-        obj.json_ext = obj.json_ext or {}
-
-        existing_additional_data = obj.json_ext.get("additional_resolve_data", {})
-        existing_additional_data[str(self.user.id)] = additional_data
-
-        obj.json_ext["additional_resolve_data"] = existing_additional_data
+            with transaction.atomic():
+                ids = list(dict.fromkeys(obj_data['ids']))
+                self.validation_class.validate_resolve_tasks(self.user, ids)
+                tasks = get_tasks(ids)
+                incoming_status = obj_data.get('business_status') or {}
+                additional_data = obj_data.get('additional_data')
+                decision = get_vote_decision(incoming_status)
+
+                pending_votes = get_pending_votes_by_task(tasks)
+                tallies = self._get_vote_tallies(tasks, pending_votes)
+                previous_decisions = self._get_previous_decisions(tasks)
+                applied = self._merge_vote_in_database(tasks, incoming_status, additional_data, pending_votes)
+                votes = TaskVote.objects.bulk_create([
+                    TaskVote(task=task, user=self.user, business_status=incoming_status,
+                             additional_data=additional_data, decision=decision, applied=applied)
+                    for task in tasks
+                ])
+
+                changed_tallies = []
+                for task in tasks:
+                    previous_decision = previous_decisions[task.id]
+                    if decision != previous_decision:
+                        tally = tallies[task.id]
+                        tally.count_decision(previous_decision, -1)
+                        tally.count_decision(decision)
+                        changed_tallies.append(tally)
+                TaskVoteTally.objects.bulk_update(changed_tallies, ['approved', 'failed'])
+
+                if not applied:
+                    for vote in votes:
+                        pending_votes[vote.task_id].append(vote)
+                return output_result_success({
+                    'tasks': [self._task_representation(task, pending_votes[task.id]) for task in tasks],
+                    'user': {'id': f"{self.user.id}"},
+                    'tallies': {
+                        str(task.id): {'approved': tallies[task.id].approved, 'failed': tallies[task.id].failed,
+                                       'executors': tallies[task.id].executors}
+                        for task in tasks
+                    },
+                })
+        except Exception as exc:
+            return output_exception(model_name=self.OBJECT_TYPE.__name__, method="resolve_tasks", exception=exc)
 
-    def __deep_merge(self, dict1, dict2):
+    def _lock_open_task(self, task_id):
         """
-        Merges two dictionaries, deeply combining them.
+        Locks the task row and reloads the (possibly shared and stale) instance, raising if a concurrent
+        resolver already completed or failed the task, so it is never completed twice.
         """
-        result = copy.deepcopy(dict1)
-
-        for key, value in dict2.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self.__deep_merge(result[key], value)
-            elif key in result and isinstance(result[key], list) and isinstance(value, list):
-                result[key] = result[key] + value
-            else:
-                result[key] = copy.deepcopy(value)
-
-        return result
+        task = self._get_task(task_id)
+        list(Task.objects.select_for_update().filter(id=task.id).values_list('id', flat=True))
+        task.refresh_from_db()
+        errors = validate_task_instance_status(task)
+        if errors:
+            raise ValidationError(errors)
+        return task
+
+    def _get_task(self, task_id):
+        task = get_task(task_id)
+        if task is None:
+            raise self.OBJECT_TYPE.DoesNotExist(f"Task {task_id} does not exist")
+        return task
+
+    def _add_vote(self, task, incoming_status, additional_data):
+        # Votes are only appended, the task row is not rewritten until the task is completed
+        tally = self._get_vote_tally(task)
+        decision = get_vote_decision(incoming_status)
+        previous_decision = self._get_previous_decision(task)
+        applied = self._merge_vote_in_database([task], incoming_status or {}, additional_data)
+        TaskVote.objects.create(task=task, user=self.user, business_status=incoming_status or {},
+                                additional_data=additional_data, decision=decision, applied=applied)
+        if decision != previous_decision:
+            tally.count_decision(previous_decision, -1)
+            tally.count_decision(decision)
+            tally.save()
+        return tally
+
+    def _merge_vote_in_database(self, tasks, incoming_status, additional_data, pending_votes=None):
+        """
+        In the `database` business_status_merge_mode the vote is deep-merged into Task.business_status (and its
+        additional data into json_ext) of the given tasks by a single UPDATE using tasks_management_jsonb_deep_merge,
+        without loading and copying the documents in python. The UPDATE bumps the version, history rows are inserted
+        in bulk and the object cache is refreshed, as for a regular save. Votes still pending (e.g. stored before the
+        mode was switched) are applied first, so they are never merged over the newer vote.
+        Returns True if the vote was applied this way.
+        """
+        if TasksManagementConfig.business_status_merge_mode != 'database' or connection.vendor != 'postgresql':
+            return False
+
+        if pending_votes is None:
+            pending_votes = get_pending_votes_by_task(tasks)
+        self._apply_pending_votes_in_bulk(tasks, pending_votes)
+
+        columns = {field: Task._meta.get_field(field).column
+                   for field in ('business_status', 'json_ext', 'version', 'date_updated', 'user_updated')}
+        sql = f'''
+            UPDATE "{Task._meta.db_table}"
+            SET "{columns['business_status']}" = tasks_management_jsonb_deep_merge(
+                    "{columns['business_status']}", %s::jsonb),
+                "{columns['json_ext']}" = CASE WHEN %s::jsonb IS NULL THEN "{columns['json_ext']}" ELSE jsonb_set(
+                    COALESCE("{columns['json_ext']}", '{{}}'::jsonb), '{{additional_resolve_data}}',
+                    COALESCE("{columns['json_ext']}" -> 'additional_resolve_data', '{{}}'::jsonb)
+                        || jsonb_build_object(%s::text, %s::jsonb)) END,
+                "{columns['version']}" = "{columns['version']}" + 1,
+                "{columns['date_updated']}" = %s,
+                "{columns['user_updated']}" = %s::uuid
+            WHERE "{Task._meta.pk.column}" = ANY(%s::uuid[])
+            RETURNING "{Task._meta.pk.column}", "{columns['business_status']}", "{columns['json_ext']}",
+                "{columns['version']}"
+        '''
+        now = datetime.datetime.now()
+        additional_data_json = json.dumps(additional_data, cls=DjangoJSONEncoder) if additional_data else None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [json.dumps(incoming_status, cls=DjangoJSONEncoder), additional_data_json,
+                                 str(self.user.id), additional_data_json, now, str(self.user.id),
+                                 [str(task.id) for task in tasks]])
+            merged = {str(row[0]): row[1:] for row in cursor}
+
+        # keeps the shared instances in sync, so a later save does not overwrite the merged values
+        for task in tasks:
+            business_status, json_ext, version = merged[str(task.id)]
+            task.business_status = _load_json(business_status)
+            task.json_ext = _load_json(json_ext)
+            task.version = version
+            task.date_updated = now
+            task.user_updated = self.user
+        Task.history.bulk_history_create(tasks, update=True, default_user=self.user)
+        Task.bulk_update_cache(tasks)
+        return True
+
+    def _apply_pending_votes_in_bulk(self, tasks, pending_votes):
+        """
+        Applies the pending votes of many tasks with one bulk_update and marks them applied, pending_votes (keyed by
+        task id) is emptied for the updated tasks.
+        """
+        tasks_with_votes = [task for task in tasks if pending_votes[task.id]]
+        if not tasks_with_votes:
+            return
+        for task in tasks_with_votes:
+            task.business_status = derive_business_status(task, pending_votes[task.id])
+            task.json_ext = derive_json_ext(task, pending_votes[task.id])
+            pending_votes[task.id] = []
+        Task.objects.bulk_update(tasks_with_votes, ['business_status', 'json_ext'])
+        TaskVote.objects.filter(task_id__in=[task.id for task in tasks_with_votes], applied=False) \
+            .update(applied=True)
+
+    def _get_previous_decision(self, task):
+        previous_vote = TaskVote.objects.filter(task=task, user=self.user).order_by('-date_created').first()
+        if previous_vote:
+            return previous_vote.decision
+        # decision stored in business_status before votes were recorded
+        return get_decision((task.business_status or {}).get(str(self.user.id)))
+
+    def _get_vote_tally(self, task):
+        # The tally row is locked until the vote is stored, serializing concurrent resolvers of the task
+        tally = TaskVoteTally.objects.select_for_update().filter(task=task).first()
+        if tally:
+            return tally
+        try:
+            with transaction.atomic():
+                return TaskVoteTally.objects.create(task=task, **count_vote_tally(task))
+        except IntegrityError:
+            return TaskVoteTally.objects.select_for_update().get(task=task)
+
+    def _get_previous_decisions(self, tasks):
+        previous_decisions = {task.id: get_decision((task.business_status or {}).get(str(self.user.id)))
+                              for task in tasks}
+        previous_votes = TaskVote.objects \
+            .filter(task_id__in=previous_decisions.keys(), user=self.user) \
+            .order_by('date_created') \
+            .values_list('task_id', 'decision')
+        # the latest vote of the user wins
+        previous_decisions.update(previous_votes)
+        return previous_decisions
+
+    def _get_vote_tallies(self, tasks, pending_votes):
+        tallies = {tally.task_id: tally for tally in
+                   TaskVoteTally.objects.select_for_update().filter(task_id__in=[task.id for task in tasks])}
+        missing = [task for task in tasks if task.id not in tallies]
+        if missing:
+            executors = count_task_group_executors({task.task_group_id for task in missing})
+            TaskVoteTally.objects.bulk_create([
+                TaskVoteTally(task=task, **count_vote_tally(task, pending_votes[task.id],
+                                                            executors.get(task.task_group_id, 0)))
+                for task in missing
+            ], ignore_conflicts=True)
+            tallies.update({tally.task_id: tally for tally in
+                            TaskVoteTally.objects.select_for_update().filter(task_id__in=[task.id for task in missing])})
+        return tallies
+
+    def _task_representation(self, task, votes=None):
+        if votes is None:
+            votes = get_pending_votes(task)
+        representation = model_representation(task)
+        representation['business_status'] = derive_business_status(task, votes)
+        representation['json_ext'] = derive_json_ext(task, votes)
+        return representation
+
+    def _apply_pending_votes(self, task):
+        votes = get_pending_votes(task)
+        if votes:
+            task.business_status = derive_business_status(task, votes)
+            task.json_ext = derive_json_ext(task, votes)
+        return votes
 
 
 class TaskGroupService(BaseService):
@@ -133,6 +450,7 @@ class TaskGroupService(BaseService):
                 obj_: TaskGroup = self.OBJECT_TYPE(**obj_data)
                 task_group_output = self.save_instance(obj_)
                 task_group_id = task_group_output['data']['id']
+                self._update_task_source_routes(task_group_id, task_sources)
                 task_executor_service = TaskExecutorService(self.user)
                 # TODO: it would be good to override bulk_create and use it here
                 for user_id in user_ids:
@@ -155,14 +473,22 @@ class TaskGroupService(BaseService):
                 task_allowed_sources = obj_data.pop('task_allowed_sources')
                 task_group_id = obj_data.get('id')
                 task_group = TaskGroup.objects.get(id=task_group_id)
+                completion_rule = self._get_completion_rule(task_group)
                 json_ext = task_group.json_ext if task_group.json_ext else dict()
                 obj_data = {**obj_data, "json_ext": {**json_ext, "task_sources": list(task_sources)},
                             "task_allowed_sources": {"allowed_task_sources": list(task_allowed_sources)}}
                 current_task_executors = task_group.taskexecutor_set.filter(is_deleted=False)
                 current_user_ids = current_task_executors.values_list('user__id', flat=True)
-                if set(current_user_ids) != set(user_ids):
+                executors_changed = set(current_user_ids) != set(user_ids)
+                if executors_changed:
                     self._update_task_group_task_executors(task_group, user_ids)
-                return super().update(obj_data)
+                output = super().update(obj_data)
+                if output['success']:
+                    self._update_task_source_routes(task_group_id, task_sources)
+                    task_group = TaskGroup.objects.get(id=task_group_id)
+                    if executors_changed or completion_rule != self._get_completion_rule(task_group):
+                        self._complete_resolved_tasks(task_group)
+                return output
         except Exception as exc:
             return output_exception(model_name=self.OBJECT_TYPE.__name__, method="update", exception=exc)
 
@@ -174,20 +500,60 @@ class TaskGroupService(BaseService):
             for user_id in user_ids:
                 service.create({'task_group_id': task_group.id,
                                 'user_id': user_id})
+            TaskVoteTally.objects \
+                .filter(task__task_group=task_group, task__status__in=[Task.Status.RECEIVED, Task.Status.ACCEPTED]) \
+                .update(executors=count_task_executors(task_group.id))
         except Exception as exc:
             raise exc
 
+    @staticmethod
+    def _get_completion_rule(task_group):
+        return task_group.completion_policy, task_group.completion_threshold, task_group.completion_threshold_type
+
+    def _complete_resolved_tasks(self, task_group):
+        """
+        Re-evaluates the completion policy for all open tasks of the group from their vote tallies, completing the
+        ones that meet the (changed) policy.
+        """
+        tallies = TaskVoteTally.objects.filter(
+            task__task_group=task_group,
+            task__status=Task.Status.ACCEPTED,
+            task__is_deleted=False,
+            task__executor_action_event=TasksManagementConfig.default_executor_event,
+        )
+        tallies = {tally.task_id: tally for tally in tallies.select_related('task')}
+        tasks = [tally.task for tally in tallies.values()]
+        for task in tasks:
+            task.task_group = task_group
+        TaskService(self.user).complete_tasks_if_policy_met(tasks, tallies)
+
     def delete(self, obj_data: Dict[str, any]):
         id = obj_data.get("id")
         if id:
             task_group = TaskGroup.objects.filter(id=id).first()
             task_group.taskexecutor_set.all().delete()
-        return super().delete(obj_data)
+        output = super().delete(obj_data)
+        if id and output['success']:
+            TaskSourceRoute.objects.filter(task_group_id=id).delete()
+        task_source_routing_cache.invalidate()
+        return output
+
+    def _update_task_source_routes(self, task_group_id, task_sources):
+        routes = TaskSourceRoute.objects.filter(task_group_id=task_group_id)
+        routes.exclude(source__in=task_sources).delete()
+        routed_sources = set(routes.values_list('source', flat=True))
+        TaskSourceRoute.objects.bulk_create([
+            TaskSourceRoute(source=source, task_group_id=task_group_id)
+            for source in task_sources if source not in routed_sources
+        ])
+        task_source_routing_cache.invalidate()
 
     def _base_payload_adjust(self, obj_data):
         task_sources = obj_data.pop('task_sources', [])
         if task_sources:
             task_sources = set(task_sources)
+        if obj_data.get('completion_threshold_type') is None:
+            obj_data.pop('completion_threshold_type', None)
         return {**obj_data, 'task_sources': task_sources}
 
 
@@ -240,9 +606,18 @@ class CreateCheckerLogicServiceMixin(ABC):
     def _adjust_create_task_data(self, entity, obj_data):
         return _get_std_crud_task_data_payload(entity, obj_data)
 
+    def _complete_create_tasks(self, objs_data):
+        """
+        Applies the create operation of many completed tasks in a single transaction, a failed create rolls back the
+        whole group and raises. Override to create the objects in bulk.
+        """
+        with transaction.atomic():
+            return raise_failed_outputs([self.create(obj_data) for obj_data in objs_data])
+
     def _get_business_data_serializer(self):
         return f'{self.__class__.__module__}.{self.__class__.__name__}._business_data_serializer'
 
+    @non_mutating_serializer
     def _business_data_serializer(self, data):
         return data
 
@@ -292,9 +667,18 @@ class UpdateCheckerLogicServiceMixin(ABC):
     def _adjust_update_task_data(self, entity, obj_data):
         return _get_std_crud_task_data_payload(entity, obj_data)
 
+    def _complete_update_tasks(self, objs_data):
+        """
+        Applies the update operation of many completed tasks in a single transaction, a failed update rolls back the
+        whole group and raises. Override to update the objects in bulk.
+        """
+        with transaction.atomic():
+            return raise_failed_outputs([self.update(obj_data) for obj_data in objs_data])
+
     def _get_business_data_serializer(self):
         return f'{self.__class__.__module__}.{self.__class__.__name__}._business_data_serializer'
 
+    @non_mutating_serializer
     def _business_data_serializer(self, data):
         return data
 
@@ -344,9 +728,18 @@ class DeleteCheckerLogicServiceMixin(ABC):
     def _adjust_delete_task_data(self, entity, obj_data):
         return _get_std_crud_task_data_payload(entity, obj_data)
 
+    def _complete_delete_tasks(self, objs_data):
+        """
+        Applies the delete operation of many completed tasks in a single transaction, a failed delete rolls back the
+        whole group and raises. Override to delete the objects in bulk.
+        """
+        with transaction.atomic():
+            return raise_failed_outputs([self.delete(obj_data) for obj_data in objs_data])
+
     def _get_business_data_serializer(self):
         return f'{self.__class__.__module__}.{self.__class__.__name__}._business_data_serializer'
 
+    @non_mutating_serializer
     def _business_data_serializer(self, data):
         return data
 
@@ -362,12 +755,25 @@ class CheckerLogicServiceMixin(CreateCheckerLogicServiceMixin,
     pass
 
 
+def raise_failed_outputs(outputs):
+    """
+    Returns the service outputs, raising a ValidationError with their details if any of them failed.
+    """
+    errors = [output.get('detail') for output in outputs if not output.get('success', True)]
+    if errors:
+        raise ValidationError(errors)
+    return outputs
+
+
 def on_task_complete_service_handler(service_type):
     """
     Generic complete_task handler any combination of CreateCheckerLogicServiceMixin,
     UpdateCheckerLogicServiceMixin, DeleteCheckerLogicServiceMixin. It will automatically detect available
     task business events fot that service type.
 
+    The operations are registered in the shared business event registry and the returned handler is the same for all
+    service types, so binding it from many modules still runs a single dispatch per completed task.
+
     :param service_type: BaseService subclass implementing any <Operation>CheckerLogicServiceMixin
     :return: event handler that will be able to execute task
     """
@@ -379,33 +785,139 @@ def on_task_complete_service_handler(service_type):
     if issubclass(service_type, DeleteCheckerLogicServiceMixin):
         operations.append('delete')
 
-    def service_operation_handler(operation, user, data):
-        # Run the operation form a service by name
-        # getattr(ExampleService(user), 'update')(data)
-        return getattr(service_type(user), operation)(data)
+    business_event_registry.register(service_type, operations)
+    return on_task_complete_business_event
 
-    def func(**kwargs):
-        try:
-            result = kwargs.get('result', {})
-            task = result['data']['task']
-            business_event = task['business_event']
-            # Tasks generated with CheckerLogicServiceMixin use naming scheme `ServiceName.operation` as business event.
-            # Checking if the task was generated by the mixin and if the service provided for the handler match
-            service_match = business_event.startswith(f"{service_type.__name__}.")
-            if result and result['success'] \
-                    and task['status'] == Task.Status.COMPLETED \
-                    and service_match:
-                # Extracting `operation` part from `ServiceName.operation`
-                operation = business_event.split(".")[1]
-                if operation in operations:
-                    user = User.objects.get(id=result['data']['user']['id'])
-                    data = task['data']['incoming_data']
-                    service_operation_handler(operation, user, data)
-        except Exception as e:
-            logger.error("Error while executing on_task_complete", exc_info=e)
-            return [str(e)]
-
-    return func
+
+def with_entity_string(obj_data, entities=None):
+    """
+    Task payload with the entity_string of the referenced entity. The entity is loaded unless it is given in the
+    payload or in `entities` (as returned by load_generic_entities).
+    """
+    entity = obj_data.get('entity')
+    if entity is None:
+        reference = _get_entity_reference(obj_data)
+        if not all(reference):
+            return obj_data
+        if entities is None:
+            entities = load_generic_entities([reference])
+        entity = entities.get((getattr(reference[0], 'id', reference[0]), str(reference[1])))
+    return {**obj_data, 'entity_string': get_entity_string(entity)}
+
+
+def _get_entity_reference(obj_data):
+    return obj_data.get('entity_type') or obj_data.get('entity_type_id'), obj_data.get('entity_id')
+
+
+def get_pending_votes(task):
+    return list(TaskVote.objects.filter(task=task, applied=False).order_by('date_created'))
+
+
+def get_pending_votes_by_task(tasks):
+    pending_votes = {task.id: [] for task in tasks}
+    votes = TaskVote.objects.filter(task_id__in=pending_votes.keys(), applied=False).order_by('date_created')
+    for vote in votes:
+        pending_votes[vote.task_id].append(vote)
+    return pending_votes
+
+
+def get_decision(value):
+    if value == TaskVote.Decision.FAILED:
+        return TaskVote.Decision.FAILED
+    if value == TasksManagementConfig.task_user_approved:
+        return TaskVote.Decision.APPROVED
+    return None
+
+
+def get_vote_decision(business_status):
+    """
+    Decision carried by an executor's business status, a failure takes precedence over an approval.
+    """
+    decisions = {get_decision(value) for value in business_status.values()} \
+        if isinstance(business_status, dict) else set()
+    if TaskVote.Decision.FAILED in decisions:
+        return TaskVote.Decision.FAILED
+    if TaskVote.Decision.APPROVED in decisions:
+        return TaskVote.Decision.APPROVED
+    return None
+
+
+def count_task_executors(task_group_id):
+    if not task_group_id:
+        return 0
+    return TaskExecutor.objects.filter(task_group_id=task_group_id, task_group__is_deleted=False,
+                                       is_deleted=False).count()
+
+
+def count_task_group_executors(task_group_ids):
+    return dict(TaskExecutor.objects
+                .filter(task_group_id__in=[group_id for group_id in task_group_ids if group_id],
+                        task_group__is_deleted=False, is_deleted=False)
+                .values_list('task_group_id')
+                .annotate(count=Count('id'))
+                .order_by())
+
+
+def count_vote_tally(task, votes=None, executors=None):
+    if votes is None:
+        votes = get_pending_votes(task)
+    if executors is None:
+        executors = count_task_executors(task.task_group_id)
+    decisions = [get_decision(value) for value in derive_business_status(task, votes).values()]
+    return {
+        'approved': decisions.count(TaskVote.Decision.APPROVED),
+        'failed': decisions.count(TaskVote.Decision.FAILED),
+        'executors': executors,
+    }
+
+
+def get_task_business_status(task):
+    """
+    Current business_status of a task, including the votes not yet applied to Task.business_status. To be used
+    instead of reading Task.business_status of open tasks directly.
+    """
+    return derive_business_status(task, get_pending_votes(task))
+
+
+def derive_business_status(task, votes):
+    """
+    Business status of a task: the stored business_status with the given (not yet applied) votes merged in order.
+    """
+    business_status = task.business_status or {}
+    for vote in votes:
+        business_status = deep_merge(business_status, vote.business_status)
+    return business_status
+
+
+def derive_json_ext(task, votes):
+    additional_data = {str(vote.user_id): vote.additional_data for vote in votes if vote.additional_data}
+    if not additional_data:
+        return task.json_ext
+
+    json_ext = copy.deepcopy(task.json_ext) or {}
+    json_ext["additional_resolve_data"] = {**json_ext.get("additional_resolve_data", {}), **additional_data}
+    return json_ext
+
+
+def _load_json(value):
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def deep_merge(dict1, dict2):
+    """
+    Merges two dictionaries, deeply combining them.
+    """
+    result = copy.deepcopy(dict1)
+
+    for key, value in dict2.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deep_merge(result[key], value)
+        elif key in result and isinstance(result[key], list) and isinstance(value, list):
+            result[key] = result[key] + value
+        else:
+            result[key] = copy.deepcopy(value)
+
+    return result
 
 
 def serialize_value(value):
@@ -438,7 +950,8 @@ def _get_std_task_data_payload(payload):
 
 
 def crud_business_data_builder(data, serializer):
-    serialized_data = copy.deepcopy(data)
+    # every top level value is replaced, so the input does not have to be copied deeply
+    serialized_data = dict(data)
     for data_key, data_value in data.items():
         serialized_data[data_key] = {
             key: serializer(key, value) for key, value in data_value.items()
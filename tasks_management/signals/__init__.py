@@ -1,11 +1,29 @@
 from core.service_signals import ServiceSignalBindType
 from core.signals import bind_service_signal
-from tasks_management.signals.on_task_resolve import on_task_resolve
+from tasks_management.apps import TasksManagementConfig
+from tasks_management.dispatch import executor_action_event_registry, on_task_resolve_executor_event, \
+    on_tasks_resolve_executor_event, on_tasks_complete_business_event
+from tasks_management.signals.on_task_resolve import on_task_resolve, on_tasks_resolve
 
 
 def bind_service_signals():
+    executor_action_event_registry.register(
+        TasksManagementConfig.default_executor_event,
+        on_task_resolve,
+        batch_handler=on_tasks_resolve
+    )
     bind_service_signal(
         'task_service.resolve_task',
-        on_task_resolve,
+        on_task_resolve_executor_event,
+        bind_type=ServiceSignalBindType.AFTER
+    )
+    bind_service_signal(
+        'task_service.resolve_tasks',
+        on_tasks_resolve_executor_event,
+        bind_type=ServiceSignalBindType.AFTER
+    )
+    bind_service_signal(
+        'task_service.complete_tasks',
+        on_tasks_complete_business_event,
         bind_type=ServiceSignalBindType.AFTER
     )
@@ -1,40 +1,22 @@
 import logging
 
-from core.forms import User
 from tasks_management.apps import TasksManagementConfig
-from tasks_management.models import Task
+from tasks_management.completion_policy import COMPLETION_POLICY_RESOLVERS
+from tasks_management.dispatch import get_signal_user
+from tasks_management.identity_map import get_task, get_tasks
+from tasks_management.models import Task, TaskVoteTally
+from tasks_management.resolution_jobs import enqueue_task_resolution, enqueue_task_resolutions
 from tasks_management.services import TaskService
 
 logger = logging.getLogger(__name__)
 
 
-def resolve_task_all(_task, _user):
-    if 'FAILED' in _task.business_status.values():
-        TaskService(_user).complete_task({"id": _task.id, 'failed': True})
-    n_of_approves = sum(map('APPROVED'.__eq__, _task.business_status.values()))
-    n_of_executors = _task.task_group.taskexecutor_set.filter(task_group__is_deleted=False, is_deleted=False).count()
-    if not n_of_executors:
-        logger.warning("No valid executors of task with policy ALL %s", str(_task.uuid))
-    if n_of_approves == n_of_executors:
-        TaskService(_user).complete_task({"id": _task.id})
-
-
-def resolve_task_any(_task, _user):
-    if 'FAILED' in _task.business_status.values():
-        TaskService(_user).complete_task({"id": _task.id, 'failed': True})
-    if 'APPROVED' in _task.business_status.values():
-        TaskService(_user).complete_task({"id": _task.id})
-
-
-def resolve_task_n(_task, _user):
-    # TODO for now hardcoded to any, to be updated
-    resolve_task_any(_task, _user)
-
-
 def on_task_resolve(**kwargs):
     """
     Generic event for checking the completion_policy of a task. if the task is completed or failed,
     TaskService.complete_task is called with appropriate `failed` flag.
+    The policy is evaluated from the vote tally returned by TaskService.resolve_task, without further queries.
+    With `deferred_task_resolution` enabled the evaluation is queued for the process_task_resolution_jobs worker.
     """
     try:
         result = kwargs.get('result', None)
@@ -42,25 +24,66 @@ def on_task_resolve(**kwargs):
                 and result['data']['task']['status'] == Task.Status.ACCEPTED \
                 and result['data']['task']['executor_action_event'] == TasksManagementConfig.default_executor_event:
             data = kwargs.get("result").get("data")
-            task = Task.objects.select_related('task_group').prefetch_related('task_group__taskexecutor_set').get(
-                id=data["task"]["id"])
-            user = User.objects.get(id=data["user"]["id"])
+            # Shares the instance loaded by TaskService.resolve_task when called within a task_identity_scope
+            task = get_task(data["task"]["id"])
+            user = get_signal_user(kwargs, data["user"]["id"])
 
             if not task.task_group:
                 logger.error("Resolving task not assigned to TaskGroup: %s", data['task']['id'])
                 return ['Task not assigned to TaskGroup']
 
-            resolvers = {
-                'ALL': resolve_task_all,
-                'ANY': resolve_task_any,
-                'N': resolve_task_n,
-            }
-
-            if task.task_group.completion_policy not in resolvers:
+            if task.task_group.completion_policy not in COMPLETION_POLICY_RESOLVERS:
                 logger.error("Resolving task with unknown completion_policy: %s", task.task_group.completion_policy)
                 return ['Unknown completion_policy: %s' % task.task_group.completion_policy]
 
-            resolvers[task.task_group.completion_policy](task, user)
+            if TasksManagementConfig.deferred_task_resolution:
+                enqueue_task_resolution(task, user)
+                return
+
+            tally = TaskVoteTally(task_id=task.id, **data["tally"])
+            TaskService(user).complete_if_policy_met(task, tally)
     except Exception as e:
         logger.error("Error while executing on_task_resolve", exc_info=e)
         return [str(e)]
+
+
+def on_tasks_resolve(**kwargs):
+    """
+    Batch counterpart of on_task_resolve for TaskService.resolve_tasks. The completion policies of all resolved tasks
+    are evaluated from the returned vote tallies, tasks meeting their policy are completed with TaskService.complete_tasks
+    (or their evaluation is queued in a single insert with `deferred_task_resolution` enabled).
+    """
+    try:
+        result = kwargs.get('result', None)
+        if not result or not result['success']:
+            return
+        data = result['data']
+        task_ids = [task['id'] for task in data['tasks']
+                    if task['status'] == Task.Status.ACCEPTED
+                    and task['executor_action_event'] == TasksManagementConfig.default_executor_event]
+        if not task_ids:
+            return
+        user = get_signal_user(kwargs, data["user"]["id"])
+
+        errors = []
+        tasks = []
+        for task in get_tasks(task_ids):
+            if not task.task_group:
+                logger.error("Resolving task not assigned to TaskGroup: %s", task.id)
+                errors.append('Task not assigned to TaskGroup: %s' % task.id)
+            elif task.task_group.completion_policy not in COMPLETION_POLICY_RESOLVERS:
+                logger.error("Resolving task with unknown completion_policy: %s", task.task_group.completion_policy)
+                errors.append('Unknown completion_policy: %s' % task.task_group.completion_policy)
+            else:
+                tasks.append(task)
+
+        if TasksManagementConfig.deferred_task_resolution:
+            enqueue_task_resolutions(tasks, user)
+            return errors or None
+
+        tallies = {task.id: TaskVoteTally(task_id=task.id, **data["tallies"][str(task.id)]) for task in tasks}
+        TaskService(user).complete_tasks_if_policy_met(tasks, tallies)
+        return errors or None
+    except Exception as e:
+        logger.error("Error while executing on_tasks_resolve", exc_info=e)
+        return [str(e)]
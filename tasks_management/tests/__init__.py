@@ -1,3 +1,9 @@
 from tasks_management.tests.task_group_service_tests import TaskGroupServiceTest
 from tasks_management.tests.task_service_tests import TaskServiceTestCase
 from tasks_management.tests.task_event_tests import TaskEventTestCase
+from tasks_management.tests.completion_policy_tests import CompletionPolicyTestCase
+from tasks_management.tests.business_data_cache_tests import BusinessDataCacheTestCase
+from tasks_management.tests.task_visibility_tests import TaskVisibilityTestCase
+from tasks_management.tests.task_query_plan_tests import TaskQueryPlanTestCase
+from tasks_management.tests.dispatch_tests import BusinessEventRegistryTestCase, ExecutorActionEventRegistryTestCase
+from tasks_management.tests.pagination_tests import KeysetCursorTestCase, KeysetPaginationTestCase
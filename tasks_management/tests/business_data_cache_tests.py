@@ -0,0 +1,41 @@
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from tasks_management.apps import TasksManagementConfig
+from tasks_management.business_data_cache import BusinessDataCache
+from tasks_management.models import Task
+
+
+class BusinessDataCacheTestCase(SimpleTestCase):
+    user = mock.Mock(rights=[191001])
+
+    def setUp(self):
+        self.cache = BusinessDataCache()
+
+    @mock.patch.object(TasksManagementConfig, 'business_data_cache_alias', None)
+    @mock.patch.object(TasksManagementConfig, 'business_data_cache_size', 2)
+    def test_version_keyed_lru(self):
+        task = Task(id=uuid.uuid4(), version=1)
+        render = mock.Mock(return_value={'rendered': True})
+
+        self.cache.get_or_render(task, 'module.Service.serializer', self.user, render)
+        self.cache.get_or_render(task, 'module.Service.serializer', self.user, render)
+        self.assertEqual(render.call_count, 1)
+
+        task.version = 2
+        self.cache.get_or_render(task, 'module.Service.serializer', self.user, render)
+        self.assertEqual(render.call_count, 2)
+
+        self.cache.get_or_render(Task(id=uuid.uuid4(), version=1), 'module.Service.serializer', self.user, render)
+        self.assertEqual(self.cache.get_stats(), {'hits': 1, 'misses': 3, 'size': 2})
+
+    @mock.patch.object(TasksManagementConfig, 'business_data_cache_alias', None)
+    @mock.patch.object(TasksManagementConfig, 'business_data_cache_size', 0)
+    def test_disabled(self):
+        render = mock.Mock(return_value={})
+        task = Task(id=uuid.uuid4(), version=1)
+        self.cache.get_or_render(task, 'module.Service.serializer', self.user, render)
+        self.cache.get_or_render(task, 'module.Service.serializer', self.user, render)
+        self.assertEqual(render.call_count, 2)
@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase
+
+from tasks_management.completion_policy import evaluate_completion_policy, get_required_approvals
+from tasks_management.models import Task, TaskGroup, TaskVoteTally
+
+
+class CompletionPolicyTestCase(SimpleTestCase):
+
+    @staticmethod
+    def _task_group(policy, threshold=None, threshold_type=TaskGroup.TaskGroupCompletionThresholdType.ABSOLUTE):
+        return TaskGroup(completion_policy=policy, completion_threshold=threshold,
+                         completion_threshold_type=threshold_type)
+
+    def test_all(self):
+        task_group = self._task_group(TaskGroup.TaskGroupCompletionPolicy.ALL)
+        self.assertIsNone(evaluate_completion_policy(task_group, TaskVoteTally(approved=2, executors=3)))
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=3, executors=3)),
+                         Task.Status.COMPLETED)
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=2, failed=1, executors=3)),
+                         Task.Status.FAILED)
+
+    def test_n_absolute(self):
+        task_group = self._task_group(TaskGroup.TaskGroupCompletionPolicy.N, threshold=2)
+        self.assertIsNone(evaluate_completion_policy(task_group, TaskVoteTally(approved=1, failed=1, executors=4)))
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=2, executors=4)),
+                         Task.Status.COMPLETED)
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=1, failed=3, executors=4)),
+                         Task.Status.FAILED)
+
+    def test_n_percentage(self):
+        task_group = self._task_group(TaskGroup.TaskGroupCompletionPolicy.N, threshold=50,
+                                      threshold_type=TaskGroup.TaskGroupCompletionThresholdType.PERCENTAGE)
+        self.assertEqual(get_required_approvals(task_group, 5), 3)
+        self.assertIsNone(evaluate_completion_policy(task_group, TaskVoteTally(approved=2, executors=5)))
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=3, executors=5)),
+                         Task.Status.COMPLETED)
+
+    def test_n_without_threshold_behaves_like_any(self):
+        task_group = self._task_group(TaskGroup.TaskGroupCompletionPolicy.N)
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=1, executors=5)),
+                         Task.Status.COMPLETED)
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(failed=1, executors=3)),
+                         Task.Status.FAILED)
+        self.assertEqual(evaluate_completion_policy(task_group, TaskVoteTally(approved=1, failed=1, executors=3)),
+                         Task.Status.FAILED)
+        self.assertIsNone(evaluate_completion_policy(task_group, TaskVoteTally(executors=3)))
+
+    def test_n_without_executors(self):
+        task_group = self._task_group(TaskGroup.TaskGroupCompletionPolicy.N, threshold=2)
+        self.assertIsNone(evaluate_completion_policy(task_group, TaskVoteTally(executors=0)))
+        self.assertIsNone(evaluate_completion_policy(task_group, TaskVoteTally(failed=1, executors=0)))
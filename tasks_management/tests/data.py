@@ -1,6 +1,8 @@
 from core.models import InteractiveUser
+from core.test_helpers import LogInHelper
 from tasks_management.models import Task
 from tasks_management.models import TaskGroup
+from tasks_management.services import TaskGroupService, TaskService
 
 
 class TaskDataMixin:
@@ -64,3 +66,28 @@ class TaskDataMixin:
         cls.task_payload_resolve_all['entity'] = entity
         cls.task_payload_resolve_any['entity'] = entity
         cls.task_payload['entity'] = entity
+
+
+class TaskGroupTasksDataMixin(TaskDataMixin):
+    """
+    Admin user, executor user and a task group executed by it with accepted tasks, shared by the task list tests.
+    """
+    user = None
+    task_executor = None
+    task_group_id = None
+
+    @classmethod
+    def init_task_group_data(cls, code, tasks_count):
+        cls.user = LogInHelper().get_or_create_user_api()
+        cls.task_executor = LogInHelper().get_or_create_user_api(username='TaskExecutor')
+        cls.init_data()
+        cls.task_group_id = TaskGroupService(cls.user).create({
+            **cls.task_group_add_payload_any,
+            "code": code,
+            "user_ids": [cls.task_executor.id],
+        })['data']['id']
+        TaskService(cls.user).bulk_create([
+            {**cls.task_payload, 'entity': None, 'source': f'{code}_source_{i}',
+             'task_group_id': cls.task_group_id, 'status': Task.Status.ACCEPTED}
+            for i in range(tasks_count)
+        ])
@@ -0,0 +1,134 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from tasks_management.dispatch import BusinessEventRegistry, ExecutorActionEventRegistry, \
+    on_tasks_complete_business_event, on_task_resolve_executor_event, on_tasks_resolve_executor_event
+from tasks_management.models import Task
+
+
+def _service_type(name, module):
+    calls = []
+
+    def _complete_create_tasks(self, objs_data):
+        calls.append(objs_data)
+        return [{'success': obj_data.get('valid', True), 'detail': f"invalid {obj_data['code']}"}
+                for obj_data in objs_data]
+
+    service_type = type(name, (), {
+        '__module__': module,
+        '__init__': lambda self, user: None,
+        '_complete_create_tasks': _complete_create_tasks,
+    })
+    service_type.calls = calls
+    return service_type
+
+
+class BusinessEventRegistryTestCase(SimpleTestCase):
+    user = mock.Mock(id='user_id')
+
+    def test_register(self):
+        registry = BusinessEventRegistry()
+        service_type = _service_type('ExampleService', 'module_a')
+
+        registry.register(service_type, ['create', 'update'])
+        # registering the same service again, e.g. when binding signals twice, is allowed
+        registry.register(service_type, ['create'])
+
+        self.assertEqual(registry.get('ExampleService.create'), (service_type, 'create'))
+        self.assertEqual(registry.get('ExampleService.update'), (service_type, 'update'))
+        self.assertIsNone(registry.get('ExampleService.delete'))
+
+    def test_register_name_collision(self):
+        registry = BusinessEventRegistry()
+        service_type = _service_type('ExampleService', 'module_a')
+        registry.register(service_type, ['create'])
+
+        with self.assertRaises(ValueError):
+            registry.register(_service_type('ExampleService', 'module_b'), ['create', 'update'])
+        self.assertEqual(registry.get('ExampleService.create'), (service_type, 'create'))
+        self.assertIsNone(registry.get('ExampleService.update'))
+
+    def test_on_tasks_complete_business_event(self):
+        registry = BusinessEventRegistry()
+        service_type = _service_type('ExampleService', 'module_a')
+        registry.register(service_type, ['create'])
+        tasks = [
+            self._task('ExampleService.create', Task.Status.COMPLETED, {'code': 'a'}),
+            self._task('ExampleService.create', Task.Status.COMPLETED, {'code': 'b', 'valid': False}),
+            self._task('ExampleService.create', Task.Status.FAILED, {'code': 'c'}),
+            self._task('UnknownService.create', Task.Status.COMPLETED, {'code': 'd'}),
+        ]
+
+        with mock.patch('tasks_management.dispatch.business_event_registry', registry):
+            errors = on_tasks_complete_business_event(
+                cls_=mock.Mock(user=self.user),
+                result={'success': True, 'data': {'tasks': tasks, 'user': {'id': self.user.id}}})
+
+        self.assertEqual(service_type.calls, [[{'code': 'a'}, {'code': 'b', 'valid': False}]])
+        self.assertEqual(errors, ['invalid b'])
+        self.assertEqual(registry.unmatched_events['UnknownService.create'], 1)
+
+    @staticmethod
+    def _task(business_event, status, incoming_data):
+        return {'business_event': business_event, 'status': status, 'data': {'incoming_data': incoming_data}}
+
+
+class ExecutorActionEventRegistryTestCase(SimpleTestCase):
+    registry = None
+
+    def setUp(self):
+        self.registry = ExecutorActionEventRegistry()
+        patcher = mock.patch('tasks_management.dispatch.executor_action_event_registry', self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_resolve_runs_single_handler(self):
+        handler_a, handler_b = mock.Mock(return_value=None), mock.Mock(return_value=None)
+        self.registry.register('event_a', handler_a)
+        self.registry.register('event_b', handler_b)
+
+        on_task_resolve_executor_event(result=self._result('event_a'))
+
+        handler_a.assert_called_once()
+        handler_b.assert_not_called()
+        self.assertEqual(self.registry.get_stats()['event_a']['calls'], 1)
+        self.assertNotIn('event_b', self.registry.get_stats())
+
+    def test_resolve_unknown_event(self):
+        handler = mock.Mock(return_value=None)
+        self.registry.register('event_a', handler)
+
+        self.assertIsNone(on_task_resolve_executor_event(result=self._result('unknown_event')))
+        handler.assert_not_called()
+        self.assertEqual(self.registry.get_stats(), {})
+
+    def test_resolve_handler_error(self):
+        self.registry.register('event_a', mock.Mock(side_effect=ValueError('handler error')))
+
+        errors = on_task_resolve_executor_event(result=self._result('event_a'))
+
+        self.assertEqual(errors, ['handler error'])
+        self.assertEqual(self.registry.get_stats()['event_a']['calls'], 1)
+
+    def test_resolve_tasks(self):
+        handler_a = mock.Mock(side_effect=[ValueError('handler error'), None])
+        handler_b, batch_handler_b = mock.Mock(return_value=None), mock.Mock(return_value=None)
+        self.registry.register('event_a', handler_a)
+        self.registry.register('event_b', handler_b, batch_handler=batch_handler_b)
+        tasks = [{'id': i, 'executor_action_event': event}
+                 for i, event in enumerate(['event_a', 'event_b', 'event_a', 'unknown_event', 'event_b'])]
+        result = {'success': True, 'data': {
+            'tasks': tasks, 'user': {'id': 'user_id'}, 'tallies': {str(task['id']): {} for task in tasks}}}
+
+        errors = on_tasks_resolve_executor_event(result=result)
+
+        self.assertEqual(errors, ['handler error'])
+        self.assertEqual(handler_a.call_count, 2)
+        handler_b.assert_not_called()
+        batch_handler_b.assert_called_once()
+        self.assertEqual([task['id'] for task in batch_handler_b.call_args.kwargs['result']['data']['tasks']], [1, 4])
+
+    @staticmethod
+    def _result(executor_action_event):
+        return {'success': True, 'data': {'task': {'executor_action_event': executor_action_event}}}
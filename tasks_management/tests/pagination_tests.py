@@ -0,0 +1,84 @@
+import base64
+import datetime
+import uuid
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, TestCase
+from graphql import GraphQLError
+
+from tasks_management.gql_queries import TaskGQLType
+from tasks_management.models import Task
+from tasks_management.pagination import KeysetDjangoFilterConnectionField, decode_keyset_cursor, \
+    encode_keyset_cursor
+from tasks_management.services import TaskService
+from tasks_management.tests.data import TaskDataMixin
+
+from core.test_helpers import LogInHelper
+
+
+class KeysetCursorTestCase(SimpleTestCase):
+
+    def test_cursor_round_trip(self):
+        node = SimpleNamespace(date_created=datetime.datetime(2024, 5, 1, 12, 30, 15, 123456), id=uuid.uuid4())
+        self.assertEqual(decode_keyset_cursor(encode_keyset_cursor(node)), (node.date_created, str(node.id)))
+
+    def test_cursor_round_trip_without_date_created(self):
+        node = SimpleNamespace(date_created=None, id=uuid.uuid4())
+        self.assertEqual(decode_keyset_cursor(encode_keyset_cursor(node)), (None, str(node.id)))
+
+    def test_invalid_cursor(self):
+        invalid_cursors = [
+            'not a cursor',
+            base64.urlsafe_b64encode(b'{"id": "1"}').decode(),
+            base64.urlsafe_b64encode(b'{"date_created": "yesterday", "id": "%s"}' % str(uuid.uuid4()).encode())
+            .decode(),
+            base64.urlsafe_b64encode(b'{"date_created": null, "id": "not an id"}').decode(),
+            base64.urlsafe_b64encode(b'[]').decode(),
+        ]
+        for cursor in invalid_cursors:
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                decode_keyset_cursor(cursor)
+
+
+class KeysetPaginationTestCase(TestCase, TaskDataMixin):
+    user = None
+    task_ids = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = LogInHelper().get_or_create_user_api()
+        cls.init_data()
+        result = TaskService(cls.user).bulk_create([
+            {**cls.task_payload, 'entity': None, 'source': f'keyset_source_{i}'} for i in range(5)])
+        cls.task_ids = [task['id'] for task in result['data']['tasks']]
+        # rows created before date_created was set are paginated too
+        Task.objects.filter(id=cls.task_ids[0]).update(date_created=None)
+
+    def test_keyset_pages(self):
+        queryset = Task.objects.filter(id__in=self.task_ids)
+        expected = [str(task_id) for task_id in queryset
+                    .order_by('-date_created', '-id').values_list('id', flat=True)]
+        # rows without date_created come first
+        expected.remove(str(self.task_ids[0]))
+        expected.insert(0, str(self.task_ids[0]))
+
+        ids, after, has_next_page = [], None, True
+        while has_next_page:
+            connection = self._resolve(queryset, {'keyset': True, 'first': 2, 'after': after, 'exactCount': True})
+            self.assertEqual(connection.length, 5)
+            ids += [str(edge.node.id) for edge in connection.edges]
+            after = connection.page_info.end_cursor
+            has_next_page = connection.page_info.has_next_page
+
+        self.assertEqual(ids, expected)
+
+    def test_keyset_rejected_arguments(self):
+        queryset = Task.objects.filter(id__in=self.task_ids)
+        for args in ({'orderBy': ['code']}, {'offset': 0}, {'last': 2}, {'after': 'not a cursor'}):
+            with self.subTest(args=args), self.assertRaises(GraphQLError):
+                self._resolve(queryset, {'keyset': True, 'first': 2, **args})
+
+    @staticmethod
+    def _resolve(queryset, args):
+        return KeysetDjangoFilterConnectionField.resolve_connection(TaskGQLType._meta.connection, args, queryset)
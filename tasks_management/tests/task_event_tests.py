@@ -4,9 +4,11 @@ from unittest.mock import Mock
 from django.test import TestCase
 
 from core.test_helpers import create_test_interactive_user
+from tasks_management.dispatch import COMPLETE_TASKS_CONTEXT
 from tasks_management.tests.data import TaskDataMixin
-from tasks_management.services import TaskService
-from tasks_management.models import Task
+from tasks_management.resolution_jobs import enqueue_task_resolutions, process_task_resolution_jobs
+from tasks_management.services import TaskService, TaskGroupService
+from tasks_management.models import Task, TaskResolutionJob, TaskVoteTally
 
 from core.signals import REGISTERED_SERVICE_SIGNALS, bind_service_signal
 from core.service_signals import RegisteredServiceSignal, ServiceSignalBindType
@@ -44,3 +46,37 @@ class TaskEventTestCase(TestCase, TaskDataMixin):
         complete_payload = {'id': result['data']['uuid']}
         result = self.service.complete_task(complete_payload)
         self.mock_handler.complete.assert_called()
+
+    def test_resolution_jobs_complete_task_once(self):
+        task_group = TaskGroupService(self.user).create({
+            **self.task_group_add_payload_any, 'code': 'resolution_jobs_group', 'user_ids': [self.user.id]})
+        result = self.service.create({
+            **self.task_payload, 'entity': None, 'source': 'resolution_jobs_source',
+            'task_group_id': task_group['data']['id'], 'status': Task.Status.ACCEPTED})
+        task = Task.objects.get(id=result['data']['id'])
+        TaskVoteTally.objects.create(task=task, approved=1, executors=1)
+        jobs = enqueue_task_resolutions([task, task], self.user)
+        self.mock_handler.complete.reset_mock()
+
+        process_task_resolution_jobs()
+
+        self.assertEqual(self.mock_handler.complete.call_count, 1)
+        self.assertEqual(Task.objects.get(id=task.id).status, Task.Status.COMPLETED)
+        self.assertEqual(
+            TaskResolutionJob.objects.filter(id__in=[job.id for job in jobs], status=TaskResolutionJob.Status.COMPLETED)
+            .count(), 2)
+
+    def test_complete_tasks_event(self):
+        payloads = [{**self.task_payload, 'entity': None, 'source': f'complete_tasks_event_source_{i}'}
+                    for i in range(2)]
+        task_ids = [task['id'] for task in self.service.bulk_create(payloads)['data']['tasks']]
+        self.mock_handler.complete.reset_mock()
+
+        result = self.service.complete_tasks({'ids': task_ids})
+
+        self.assertTrue(result['success'], result.get('detail'))
+        self.assertEqual(self.mock_handler.complete.call_count, 2)
+        self.assertEqual({str(call.kwargs['result']['data']['task']['id']) for call in
+                          self.mock_handler.complete.call_args_list}, {str(task_id) for task_id in task_ids})
+        self.assertTrue(all(call.kwargs['context'] == COMPLETE_TASKS_CONTEXT
+                            for call in self.mock_handler.complete.call_args_list))
@@ -1,12 +1,20 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.test import TestCase
 
-from tasks_management.models import TaskGroup
-from tasks_management.services import TaskGroupService
+from tasks_management.models import TaskGroup, TaskSourceRoute, Task
+from tasks_management.routing import task_source_routing_cache
+from tasks_management.services import TaskGroupService, TaskService, CreateCheckerLogicServiceMixin
 from tasks_management.tests.data import TaskDataMixin
+from tasks_management.validation import validate_unique_task_source
 
 from core.test_helpers import LogInHelper
 
 
+class CheckerTaskGroupService(TaskGroupService, CreateCheckerLogicServiceMixin):
+    pass
+
+
 class TaskGroupServiceTest(TestCase, TaskDataMixin):
     user = None
     task_executor = None
@@ -35,3 +43,75 @@ class TaskGroupServiceTest(TestCase, TaskDataMixin):
         uuid = result.get('data', {}).get('uuid', None)
         query = self.query_all.filter(uuid=uuid)
         self.assertEqual(query.count(), 1)
+
+    def test_task_group_routes_task_sources(self):
+        payload = {**self.payload, "code": "example_routed", "task_sources": ["routed_source"]}
+        result = self.service.create(payload)
+        self.assertTrue(result.get('success', False), result.get('detail', "No details provided"))
+        task_group_id = result['data']['id']
+        self.assertTrue(TaskSourceRoute.objects.filter(source="routed_source", task_group_id=task_group_id).exists())
+
+        task_result = TaskService(self.user).create({**self.task_payload, "source": "routed_source"})
+        self.assertTrue(task_result.get('success', False), task_result.get('detail', "No details provided"))
+        task = Task.objects.get(id=task_result['data']['id'])
+        self.assertEqual(str(task.task_group_id), task_group_id)
+        self.assertEqual(task.status, Task.Status.ACCEPTED)
+
+        self.service.delete({"id": task_group_id})
+        self.assertFalse(TaskSourceRoute.objects.filter(source="routed_source").exists())
+
+    def test_validate_unique_task_source_query_count(self):
+        payload = {**self.payload, "code": "example_sources", "task_sources": [f"source_{i}" for i in range(40)]}
+        result = self.service.create(payload)
+        self.assertTrue(result.get('success', False), result.get('detail', "No details provided"))
+
+        for n_of_sources in (1, 40):
+            with self.assertNumQueries(1):
+                errors = validate_unique_task_source([f"source_{i}" for i in range(n_of_sources)])
+            self.assertEqual(len(errors), 1)
+
+        with self.assertNumQueries(1):
+            errors = validate_unique_task_source([f"source_{i}" for i in range(40)], result['data']['id'])
+        self.assertEqual(errors, [])
+
+    def test_complete_create_tasks_rolls_back_group(self):
+        service = CheckerTaskGroupService(self.user)
+        valid_payload = {**self.payload, "code": "example_completed_valid"}
+        # the second group reuses the code of the first one and fails validation
+        payloads = [valid_payload, {**self.payload, "code": "example_completed_valid"}]
+
+        with self.assertRaises(ValidationError):
+            service._complete_create_tasks(payloads)
+        self.assertFalse(self.query_all.filter(code="example_completed_valid").exists())
+
+        outputs = service._complete_create_tasks([valid_payload])
+        self.assertTrue(outputs[0]['success'], outputs[0].get('detail'))
+
+    def test_task_source_routing_rolled_back(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                payload = {**self.payload, "code": "example_rolled_back", "task_sources": ["rolled_back_source"]}
+                result = self.service.create(payload)
+                self.assertTrue(result.get('success', False), result.get('detail', "No details provided"))
+                self.assertIsNotNone(task_source_routing_cache.get("rolled_back_source"))
+                raise RuntimeError("rollback")
+
+        # the route read before the rollback is not kept in the local copy
+        self.assertIsNone(task_source_routing_cache.get("rolled_back_source"))
+
+    def test_update_threshold_validated_with_stored_type(self):
+        result = self.service.create({
+            **self.payload, "code": "example_percentage", "completion_policy": TaskGroup.TaskGroupCompletionPolicy.N,
+            "completion_threshold": 50,
+            "completion_threshold_type": TaskGroup.TaskGroupCompletionThresholdType.PERCENTAGE})
+        self.assertTrue(result.get('success', False), result.get('detail', "No details provided"))
+        task_group_id = result['data']['id']
+
+        result = self.service.update({
+            "id": task_group_id, "code": "example_percentage_invalid", "completion_threshold": 150})
+        self.assertFalse(result.get('success', True))
+        self.assertEqual(TaskGroup.objects.get(id=task_group_id).completion_threshold, 50)
+
+        result = self.service.update({
+            "id": task_group_id, "code": "example_percentage_valid", "completion_threshold": 80})
+        self.assertTrue(result.get('success', False), result.get('detail', "No details provided"))
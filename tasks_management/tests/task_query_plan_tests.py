@@ -0,0 +1,67 @@
+import datetime
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase
+
+from tasks_management.gql_queries import filter_executor_tasks
+from tasks_management.models import Task
+from tasks_management.tests.data import TaskGroupTasksDataMixin
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Query plans are checked on PostgreSQL only')
+class TaskQueryPlanTestCase(TestCase, TaskGroupTasksDataMixin):
+    """
+    Checks with the default planner settings that the main task list queries are served by their index. The task
+    group of the executor holds a small part of thousands of tasks, spread over many sources and events.
+    """
+    tasks = 20000
+    distinct_values = 500
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.init_task_group_data("query_plan_group", 50)
+        now = datetime.datetime.now()
+        tasks = [
+            Task(source=f'query_plan_source_{i % cls.distinct_values}',
+                 business_event=f'query_plan_event_{i % cls.distinct_values}',
+                 executor_action_event=f'query_plan_action_{i % cls.distinct_values}',
+                 status=Task.Status.ACCEPTED if i % 2 else Task.Status.RECEIVED,
+                 date_created=now - datetime.timedelta(seconds=i), user_created=cls.user, user_updated=cls.user)
+            for i in range(cls.tasks)
+        ]
+        for task in tasks:
+            task.set_pk()
+        Task.objects.bulk_create(tasks, batch_size=1000)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Task._meta.db_table}')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+
+    def test_triage_task_list(self):
+        self.assertUsesIndex(Task.objects.filter(is_deleted=False).order_by('-date_created')[:10],
+                             'task_date_created_id_idx')
+        self.assertUsesIndex(Task.objects.filter(is_deleted=False, status=Task.Status.ACCEPTED,
+                                                 task_group_id=self.task_group_id).order_by('-date_created')[:10],
+                             'task_open_group_status_idx')
+
+    def test_executor_task_list(self):
+        queryset = filter_executor_tasks(Task.objects.all(), self.task_executor)
+        self.assertUsesIndex(queryset.order_by('-date_created')[:10], 'task_open_group_status_idx')
+
+    def test_filter_fields(self):
+        self.assertUsesIndex(Task.objects.filter(is_deleted=False, source='query_plan_source_1'), 'task_source_idx')
+        self.assertUsesIndex(Task.objects.filter(is_deleted=False, business_event='query_plan_event_1'),
+                             'task_business_event_idx')
+        self.assertUsesIndex(Task.objects.filter(is_deleted=False, executor_action_event='query_plan_action_1'),
+                             'task_executor_event_idx')
+        self.assertUsesIndex(Task.objects.filter(entity_id__in=['1', '2']), 'task_entity_id_idx')
+
+    def test_keyset_page(self):
+        # the order of KeysetDjangoFilterConnectionField
+        queryset = Task.objects.filter(is_deleted=False).order_by(F('date_created').desc(nulls_first=True), '-id')
+        self.assertUsesIndex(queryset[:10], 'task_date_created_id_idx')
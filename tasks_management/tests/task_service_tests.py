@@ -1,12 +1,15 @@
 import copy
-from unittest import skip
+from unittest import mock, skip, skipUnless
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from tasks_management.apps import TasksManagementConfig
 from tasks_management.tests.data import TaskDataMixin
 from tasks_management.services import TaskService, TaskGroupService
-from tasks_management.models import Task
+from tasks_management.models import Task, TaskVote, TaskVoteTally
+from tasks_management.utils import get_entity_string
 from core.test_helpers import LogInHelper
 
 
@@ -38,6 +41,87 @@ class TaskServiceTestCase(TestCase, TaskDataMixin):
         obj_id = result['data']['id']
         self.assertTrue(Task.objects.filter(id=obj_id).exists())
         self.assertEqual(Task.objects.filter(id=obj_id).first().status, Task.Status.RECEIVED)
+        self.assertEqual(Task.objects.get(id=obj_id).entity_string, get_entity_string(self.task_payload['entity']))
+
+    def test_bulk_create_tasks(self):
+        payloads = [{**self.task_payload, 'entity': None, 'source': f'bulk_source_{i}'} for i in range(5)]
+        result = self.service.bulk_create(payloads)
+
+        self.assertTrue(result)
+        self.assertTrue(result['success'], result.get('detail'))
+        task_ids = [task['id'] for task in result['data']['tasks']]
+        self.assertEqual(Task.objects.filter(id__in=task_ids).count(), 5)
+        self.assertEqual(Task.history.filter(id__in=task_ids).count(), 5)
+
+    def test_bulk_create_tasks_query_count(self):
+        def count_queries(batch_size, prefix):
+            payloads = [{**self.task_payload, 'entity': None, 'source': f'{prefix}_{i}'} for i in range(batch_size)]
+            with CaptureQueriesContext(connection) as context:
+                self.assertTrue(self.service.bulk_create(payloads)['success'])
+            return len(context.captured_queries)
+
+        # warms up the task source routing cache
+        count_queries(1, 'bulk_warm_up_source')
+        self.assertEqual(count_queries(5, 'bulk_small_source'), count_queries(50, 'bulk_large_source'))
+
+    def test_resolve_tasks(self):
+        payloads = [{**self.task_payload, 'entity': None, 'source': f'resolve_source_{i}',
+                     'task_group_id': self.taskgroup_all_id, 'status': Task.Status.ACCEPTED} for i in range(3)]
+        task_ids = [task['id'] for task in self.service.bulk_create(payloads)['data']['tasks']]
+
+        result = self.service.resolve_tasks({
+            'ids': task_ids,
+            'business_status': {str(self.user.id): TasksManagementConfig.task_user_approved},
+        })
+
+        self.assertTrue(result)
+        self.assertTrue(result['success'], result.get('detail'))
+        self.assertEqual(TaskVote.objects.filter(task_id__in=task_ids, user=self.user).count(), 3)
+        tallies = TaskVoteTally.objects.filter(task_id__in=task_ids)
+        self.assertEqual([(tally.approved, tally.executors) for tally in tallies], [(1, 2)] * 3)
+
+    @skipUnless(connection.vendor == 'postgresql', 'business_status_merge_mode database requires PostgreSQL')
+    def test_resolve_tasks_merge_mode_switch(self):
+        payload = {**self.task_payload, 'entity': None, 'source': 'merge_mode_source',
+                   'task_group_id': self.taskgroup_all_id, 'status': Task.Status.ACCEPTED}
+        task_ids = [task['id'] for task in self.service.bulk_create([payload])['data']['tasks']]
+        user_key = str(self.user.id)
+        with mock.patch.object(TasksManagementConfig, 'business_status_merge_mode', 'python'):
+            self.service.resolve_tasks({'ids': task_ids, 'business_status': {user_key: 'FAILED'}})
+        version = Task.objects.get(id=task_ids[0]).version
+
+        with mock.patch.object(TasksManagementConfig, 'business_status_merge_mode', 'database'):
+            result = self.service.resolve_tasks({
+                'ids': task_ids, 'business_status': {user_key: TasksManagementConfig.task_user_approved}})
+
+        self.assertTrue(result['success'], result.get('detail'))
+        task = Task.objects.get(id=task_ids[0])
+        # the older python vote is applied first, the newer vote wins
+        self.assertEqual(task.business_status[user_key], TasksManagementConfig.task_user_approved)
+        self.assertEqual(task.version, version + 1)
+        self.assertFalse(TaskVote.objects.filter(task_id=task.id, applied=False).exists())
+        self.assertEqual(Task.history.filter(id=task.id, version=task.version).count(), 1)
+
+    def test_complete_tasks(self):
+        payloads = [{**self.task_payload, 'entity': None, 'source': f'complete_source_{i}'} for i in range(3)]
+        task_ids = [task['id'] for task in self.service.bulk_create(payloads)['data']['tasks']]
+
+        result = self.service.complete_tasks({'ids': task_ids})
+
+        self.assertTrue(result)
+        self.assertTrue(result['success'], result.get('detail'))
+        self.assertEqual(Task.objects.filter(id__in=task_ids, status=Task.Status.COMPLETED).count(), 3)
+        self.assertEqual(Task.history.filter(id__in=task_ids, status=Task.Status.COMPLETED).count(), 3)
+
+    def test_complete_task_once(self):
+        result = self.service.create({**self.task_payload, 'entity': None, 'source': 'complete_once_source'})
+        obj_id = result['data']['id']
+
+        self.assertTrue(self.service.complete_task({'id': obj_id})['success'])
+        result = self.service.complete_task({'id': obj_id, 'failed': True})
+
+        self.assertFalse(result['success'])
+        self.assertEqual(Task.objects.get(id=obj_id).status, Task.Status.COMPLETED)
 
     def test_update_task(self):
         result = self.service.create(self.task_payload)
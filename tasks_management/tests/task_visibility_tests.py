@@ -0,0 +1,31 @@
+from django.test import TestCase
+
+from tasks_management.gql_queries import filter_executor_tasks
+from tasks_management.models import Task
+from tasks_management.services import TaskExecutorService
+from tasks_management.tests.data import TaskGroupTasksDataMixin
+
+
+class TaskVisibilityTestCase(TestCase, TaskGroupTasksDataMixin):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.init_task_group_data("visibility_group", 3)
+
+    def test_executor_tasks_not_duplicated(self):
+        query = filter_executor_tasks(Task.objects.all(), self.task_executor)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(query)), 3)
+
+        # the same user listed several times in the group does not change the rows nor the number of queries
+        executor_service = TaskExecutorService(self.user)
+        for _ in range(20):
+            executor_service.create({'task_group_id': self.task_group_id, 'user_id': self.task_executor.id})
+
+        query = filter_executor_tasks(Task.objects.all(), self.task_executor)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(query)), 3)
+
+    def test_non_executor_sees_no_tasks(self):
+        self.assertFalse(filter_executor_tasks(Task.objects.all(), self.user).exists())
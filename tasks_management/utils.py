@@ -0,0 +1,27 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+
+def load_generic_entities(references):
+    """
+    Loads the entities referenced by (content type or content type id, entity id) pairs with one query per content
+    type. Returns a dict keyed by (content type id, str(entity id)), missing entities are left out.
+    """
+    entity_ids_by_type = defaultdict(set)
+    for content_type, entity_id in references:
+        if content_type and entity_id:
+            entity_ids_by_type[getattr(content_type, 'id', content_type)].add(str(entity_id))
+
+    entities = {}
+    for content_type_id, entity_ids in entity_ids_by_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        entities.update({(content_type_id, str(entity.pk)): entity
+                         for entity in model._base_manager.filter(pk__in=entity_ids)})
+    return entities
+
+
+def get_entity_string(entity):
+    return str(entity) if entity is not None else None
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext as _
 from django.db.models import Q
@@ -6,7 +8,12 @@ from django.contrib.contenttypes.models import ContentType
 from core.models import User
 from core.validation import BaseModelValidation, UniqueCodeValidationMixin, ObjectExistsValidationMixin, \
     StringFieldValidationMixin
-from tasks_management.models import TaskGroup, TaskExecutor, Task
+from tasks_management.identity_map import get_task, get_tasks
+from tasks_management.models import TaskGroup, TaskExecutor, Task, TaskSourceRoute
+from tasks_management.utils import load_generic_entities
+
+
+PENDING_TASK_STATUSES = [Task.Status.RECEIVED, Task.Status.ACCEPTED]
 
 
 class TaskGroupValidation(BaseModelValidation, UniqueCodeValidationMixin, ObjectExistsValidationMixin,
@@ -53,6 +60,14 @@ class TaskValidation(BaseModelValidation, ObjectExistsValidationMixin):
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def validate_bulk_create(cls, user, data_list, entities=None):
+        for data in data_list:
+            super().validate_create(user, **data)
+        errors = validate_existing_tasks(data_list, entities)
+        if errors:
+            raise ValidationError(errors)
+
     @classmethod
     def validate_update(cls, user, **data):
         super().validate_update(user, **data)
@@ -62,18 +77,47 @@ class TaskValidation(BaseModelValidation, ObjectExistsValidationMixin):
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def validate_resolve_tasks(cls, user, ids):
+        super().validate_update(user, ids=ids)
+        tasks = {str(task.id): task for task in get_tasks(ids)}
+        missing_ids = [task_id for task_id in ids if str(task_id) not in tasks]
+        if missing_ids:
+            raise ValidationError(cls.INVALID_UPDATE_ID_MSG % {'id': missing_ids, 'model': str(cls.OBJECT_TYPE)})
+        errors = [error for task in tasks.values() for error in validate_task_instance_status(task)]
+        if errors:
+            raise ValidationError(errors)
+
     @classmethod
     def validate_delete(cls, user, **data):
         super().validate_delete(user, **data)
 
+    @classmethod
+    def validate_object_exists(cls, id_):
+        if not get_task(id_):
+            raise ValidationError(cls.INVALID_UPDATE_ID_MSG % {'id': id_, 'model': str(cls.OBJECT_TYPE)})
+
 
 def validate_task_group(data, uuid=None):
     return [
         *validate_not_empty_field(data.get("code"), "code"),
-        *validate_unique_task_source(data.get("task_sources"), uuid)
+        *validate_unique_task_source(data.get("task_sources"), uuid),
+        *validate_completion_threshold(*_get_completion_threshold(data, uuid)),
     ]
 
 
+def _get_completion_threshold(data, uuid=None):
+    # on update the threshold or its type missing from the payload is the stored one
+    threshold, threshold_type = data.get("completion_threshold"), data.get("completion_threshold_type")
+    if uuid and (threshold is None) != (threshold_type is None):
+        stored = TaskGroup.objects.filter(id=uuid).values_list(
+            "completion_threshold", "completion_threshold_type").first()
+        if stored:
+            threshold = stored[0] if threshold is None else threshold
+            threshold_type = stored[1] if threshold_type is None else threshold_type
+    return threshold, threshold_type
+
+
 def validate_task_executor(data, uuid=None):
     return [
         *validate_user_exists(data.get("user_id"))
@@ -81,7 +125,10 @@ def validate_task_executor(data, uuid=None):
 
 
 def validate_task_status(uuid):
-    instance = Task.objects.get(id=uuid)
+    return validate_task_instance_status(get_task(uuid))
+
+
+def validate_task_instance_status(instance):
     instance_status = instance.status
     if instance_status in [Task.Status.COMPLETED, Task.Status.FAILED]:
         return [
@@ -89,6 +136,16 @@ def validate_task_status(uuid):
     return []
 
 
+def validate_completion_threshold(threshold, threshold_type):
+    if threshold is None:
+        return []
+    is_percentage = threshold_type == TaskGroup.TaskGroupCompletionThresholdType.PERCENTAGE
+    if threshold < 1 or (is_percentage and threshold > 100):
+        return [{"message": _("tasks_management.validation.task_group.invalid_completion_threshold") % {
+            'threshold': threshold}}]
+    return []
+
+
 def validate_user_exists(user_id):
     if not User.objects.filter(id=user_id).exists():
         return [{"message": _("tasks_management.validation.group_executor.user_does_not_exist") % {'code': user_id}}]
@@ -106,38 +163,67 @@ def validate_not_empty_field(string, field):
 
 
 def validate_existing_task(data):
-    content_type = data.get('entity_type')
-    entity_id = data.get('entity_id')
-
-    if isinstance(content_type, ContentType):
-        try:
-            entity_instance = content_type.get_object_for_this_type(id=entity_id)
-        except content_type.model_class().DoesNotExist:
-            return [{"message": _("tasks_management.validation.entity_not_found") % {'entity_id': entity_id}}]
-
-        filtered_tasks = Task.objects.filter(
-            Q(entity_type=content_type) &
-            Q(entity_id=str(entity_id)) &
-            (Q(status=Task.Status.ACCEPTED) | Q(status=Task.Status.RECEIVED))
-        )
-
-        if filtered_tasks.exists():
-            return [
-                {"message": _("tasks_management.validation.another_task_pending") % {'instance': str(entity_instance)}}]
-    return []
+    return validate_existing_tasks([data])
+
+
+def validate_existing_tasks(data_list, entities=None):
+    """
+    Checks that the entities referenced by the tasks exist and have no pending (received or accepted) task, also
+    reporting entities referenced more than once in data_list. Entities are taken from `entities` (as returned by
+    load_generic_entities) or loaded with one query per entity type, pending tasks are checked with one query in total,
+    backed by the partial `task_pending_entity_idx` index.
+    """
+    entity_ids_by_type = defaultdict(list)
+    for data in data_list:
+        content_type = data.get('entity_type')
+        if isinstance(content_type, ContentType):
+            entity_ids_by_type[content_type].append(str(data.get('entity_id')))
+
+    if entities is None:
+        entities = load_generic_entities(
+            (content_type, entity_id) for content_type, entity_ids in entity_ids_by_type.items()
+            for entity_id in entity_ids)
+
+    errors = []
+    found = set()
+    for content_type, entity_ids in entity_ids_by_type.items():
+        for entity_id in set(entity_ids):
+            if (content_type.id, entity_id) in entities:
+                found.add((content_type.id, entity_id))
+            else:
+                errors.append({"message": _("tasks_management.validation.entity_not_found") % {
+                    'entity_id': entity_id}})
+
+    if not found:
+        return errors
+
+    entities_filter = Q()
+    for content_type, entity_ids in entity_ids_by_type.items():
+        entities_filter |= Q(entity_type=content_type, entity_id__in=set(entity_ids))
+    pending = set(Task.objects
+                  .filter(entities_filter, status__in=PENDING_TASK_STATUSES)
+                  .values_list('entity_type_id', 'entity_id'))
+    for content_type, entity_ids in entity_ids_by_type.items():
+        seen = set()
+        for entity_id in entity_ids:
+            key = (content_type.id, entity_id)
+            if key in found and (key in pending or entity_id in seen):
+                errors.append({"message": _("tasks_management.validation.another_task_pending") % {
+                    'instance': str(entities[key])}})
+            seen.add(entity_id)
+    return errors
 
 
 def validate_unique_task_source(task_sources, group_id=None):
-    task_groups_by_source = {}
+    if not task_sources:
+        return []
 
-    queryset = TaskGroup.objects.filter(is_deleted=False)
+    # Conflicts for all sources are resolved in a single query on the unique TaskSourceRoute.source index
+    queryset = TaskSourceRoute.objects.filter(source__in=task_sources, task_group__is_deleted=False)
     if group_id:
-        queryset = queryset.exclude(id=group_id)
+        queryset = queryset.exclude(task_group_id=group_id)
 
-    for task_source in task_sources:
-        instance = queryset.filter(json_ext__contains={"task_sources": [task_source]}).first()
-        if instance:
-            task_groups_by_source[task_source] = instance.code
+    task_groups_by_source = dict(queryset.values_list('source', 'task_group__code'))
 
     if task_groups_by_source:
         return [{"message": _("tasks_management.validation.validate_unique_task_source") % {